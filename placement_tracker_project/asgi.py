@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'placement_tracker_project.settings')
+# Serve the hot read endpoints with async views; see tracker_app.async_views
+os.environ.setdefault('API_ASYNC_VIEWS', 'True')
 
 application = get_asgi_application()
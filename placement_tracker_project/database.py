@@ -0,0 +1,75 @@
+"""
+Database configuration shared by every settings module.
+
+``database_config`` turns ``DATABASE_URL`` into ``DATABASES['default']``.
+Without a URL it falls back to SQLite. For PostgreSQL, ``pool_mode`` picks
+how connections are reused:
+
+``pool``
+    psycopg 3's connection pool (Django's ``OPTIONS['pool']``): each process
+    keeps between ``min_size`` and ``max_size`` open connections and
+    requests borrow one for their duration, waiting up to ``timeout``
+    seconds when all are busy. Needs ``psycopg[pool]``; without it this
+    mode falls back to ``persistent``.
+``pgbouncer``
+    For a PgBouncer (or Neon's pooled endpoint) in transaction pooling mode:
+    persistent connections to the bouncer, no server-side cursors and no
+    prepared statements, neither of which survive a transaction boundary.
+``persistent``
+    One connection per thread, reused for ``conn_max_age`` seconds and
+    health-checked before reuse.
+
+URL query parameters (e.g. ``?sslmode=disable`` for a local server) are
+passed through as connection options; ``sslmode`` otherwise defaults to
+``require``.
+"""
+import importlib.util
+
+import dj_database_url
+
+
+POOL_MODES = ('pool', 'pgbouncer', 'persistent')
+
+
+def _installed(module):
+    return importlib.util.find_spec(module) is not None
+
+
+def database_config(
+    url,
+    sqlite_path,
+    pool_mode='pool',
+    pool_min_size=2,
+    pool_max_size=10,
+    pool_timeout=10,
+    conn_max_age=600,
+    sslmode='require',
+):
+    if not url:
+        return {'ENGINE': 'django.db.backends.sqlite3', 'NAME': sqlite_path}
+    if pool_mode not in POOL_MODES:
+        raise ValueError(f'DATABASE_POOL_MODE must be one of: {", ".join(POOL_MODES)}')
+
+    database = dj_database_url.parse(url)
+    if database['ENGINE'] != 'django.db.backends.postgresql':
+        database.update(CONN_MAX_AGE=conn_max_age, CONN_HEALTH_CHECKS=True)
+        return database
+
+    options = database.setdefault('OPTIONS', {})
+    options.setdefault('sslmode', sslmode)
+
+    if pool_mode == 'pool' and _installed('psycopg') and _installed('psycopg_pool'):
+        options['pool'] = {'min_size': pool_min_size, 'max_size': pool_max_size, 'timeout': pool_timeout}
+        # The pool owns connection reuse, so Django returns connections after
+        # each request; health checks make the pool test a connection before
+        # lending it, since idle ones may have been closed server side
+        database.update(CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=True)
+        return database
+
+    database.update(CONN_MAX_AGE=conn_max_age, CONN_HEALTH_CHECKS=True)
+    if pool_mode == 'pgbouncer':
+        database['DISABLE_SERVER_SIDE_CURSORS'] = True
+        if _installed('psycopg'):
+            # psycopg 3 prepares statements after repeated use; psycopg2 never does
+            options['prepare_threshold'] = None
+    return database
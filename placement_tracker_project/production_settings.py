@@ -15,10 +15,8 @@ SECRET_KEY = os.environ.get('SECRET_KEY', SECRET_KEY)
 ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '').split(',')
 
 # Database
-# Use PostgreSQL in production
-if os.environ.get('DATABASE_URL'):
-    import dj_database_url
-    DATABASES['default'] = dj_database_url.parse(os.environ.get('DATABASE_URL'))
+# DATABASES comes from settings.py (see database.py), so DATABASE_URL and the
+# DATABASE_POOL_* variables configure connection pooling in both profiles
 
 # Static files (CSS, JavaScript, Images)
 # Use WhiteNoise for serving static files in production
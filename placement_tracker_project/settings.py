@@ -13,9 +13,10 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 import os
 from pathlib import Path
 from decouple import config
-import dj_database_url
 from datetime import timedelta
 
+from .database import database_config
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -50,13 +51,15 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'tracker_app.middleware.StaticFilesMiddleware',
+    'tracker_app.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'tracker_app.middleware.PasswordHashingBusyMiddleware',
 ]
 
 ROOT_URLCONF = 'placement_tracker_project.urls'
@@ -77,28 +80,146 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'placement_tracker_project.wsgi.application'
+ASGI_APPLICATION = 'placement_tracker_project.asgi.application'
+
+# Serve the hot read endpoints with async views (tracker_app.async_views).
+# asgi.py turns this on; under WSGI the sync views are faster.
+API_ASYNC_VIEWS = config('API_ASYNC_VIEWS', default=False, cast=bool)
 
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
-DATABASE_URL = config('DATABASE_URL', default=None)
-if DATABASE_URL:
-    DATABASES = {
-        'default': dj_database_url.parse(DATABASE_URL, conn_max_age=600, conn_health_checks=True)
-    }
-    # Specific configurations for PostgreSQL/Neon DB
-    DATABASES['default']['OPTIONS'] = {
-        'sslmode': 'require',
+# See database.py for DATABASE_POOL_MODE: pool (psycopg 3 pool), pgbouncer or persistent
+DATABASES = {
+    'default': database_config(
+        config('DATABASE_URL', default=None),
+        sqlite_path=BASE_DIR / 'db.sqlite3',
+        pool_mode=config('DATABASE_POOL_MODE', default='pool'),
+        pool_min_size=config('DATABASE_POOL_MIN_SIZE', default=2, cast=int),
+        pool_max_size=config('DATABASE_POOL_MAX_SIZE', default=10, cast=int),
+        pool_timeout=config('DATABASE_POOL_TIMEOUT', default=10, cast=float),
+        conn_max_age=config('DATABASE_CONN_MAX_AGE', default=600, cast=int),
+        sslmode=config('DATABASE_SSLMODE', default='require'),
+    )
+}
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+# Set CACHE_URL (redis://...) whenever more than one process serves requests.
+# Invalidations (user versions, revoked access tokens) travel through this
+# cache, so without it each process would only see its own. SHARED_CACHE
+# tells those features whether they can rely on it; when it is False they
+# fall back to short local lifetimes and database checks.
+CACHE_URL = config('CACHE_URL', default='')
+SHARED_CACHE = bool(CACHE_URL)
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
     }
 else:
-    DATABASES = {
+    CACHES = {
         'default': {
-            'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': BASE_DIR / 'db.sqlite3',
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'tracky-default',
+            'OPTIONS': {
+                'MAX_ENTRIES': config('CACHE_MAX_ENTRIES', default=10000, cast=int),
+            },
         }
     }
 
+# Revoked access tokens must be visible to every worker. Without CACHE_URL
+# they are kept in the AccessTokenRevocation table, which costs one
+# primary-key query per token check.
+DENYLIST_CACHE_ALIAS = 'denylist'
+if SHARED_CACHE:
+    CACHES[DENYLIST_CACHE_ALIAS] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': CACHE_URL,
+    }
+# A token found not revoked is not looked up again for this many seconds, so
+# a revocation made by another worker can take this long to apply there
+DENYLIST_LOCAL_TTL = config('DENYLIST_LOCAL_TTL', default=5, cast=int)
+
+# Throttle counters must be shared by every worker to mean anything; they use
+# CACHE_URL unless THROTTLE_CACHE_URL points elsewhere. The local-memory
+# fallback counts per process.
+THROTTLE_CACHE_ALIAS = 'throttle'
+THROTTLE_CACHE_URL = config('THROTTLE_CACHE_URL', default=CACHE_URL)
+if THROTTLE_CACHE_URL:
+    CACHES[THROTTLE_CACHE_ALIAS] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': THROTTLE_CACHE_URL,
+    }
+else:
+    CACHES[THROTTLE_CACHE_ALIAS] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'tracky-throttle',
+    }
+
+# Dashboard payload cache (seconds); invalidated per user on every application write
+DASHBOARD_CACHE_TIMEOUT = config('DASHBOARD_CACHE_TIMEOUT', default=300, cast=int)
+# Without CACHE_URL invalidations only reach the worker that made the write,
+# so cached dashboards and counts live this long at most
+DASHBOARD_LOCAL_CACHE_TIMEOUT = config('DASHBOARD_LOCAL_CACHE_TIMEOUT', default=5, cast=int)
+DASHBOARD_CACHE_LOCK_TIMEOUT = config('DASHBOARD_CACHE_LOCK_TIMEOUT', default=10, cast=int)
+
+# Cards returned per Kanban column by /api/dashboard/stats/ (?cards=N, capped at the maximum)
+DASHBOARD_CARDS_PER_COLUMN = config('DASHBOARD_CARDS_PER_COLUMN', default=10, cast=int)
+DASHBOARD_MAX_CARDS_PER_COLUMN = config('DASHBOARD_MAX_CARDS_PER_COLUMN', default=100, cast=int)
+
+# Maximum number of operations accepted by /api/applications/bulk/
+APPLICATIONS_BULK_MAX_OPERATIONS = config('APPLICATIONS_BULK_MAX_OPERATIONS', default=200, cast=int)
+
+# Rows fetched per round trip by streaming exports (server-side cursor on PostgreSQL)
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# Rows validated and inserted per transaction by imports, and row errors reported back
+APPLICATIONS_IMPORT_BATCH_SIZE = config('APPLICATIONS_IMPORT_BATCH_SIZE', default=1000, cast=int)
+APPLICATIONS_IMPORT_MAX_ERRORS = config('APPLICATIONS_IMPORT_MAX_ERRORS', default=1000, cast=int)
+
+# How long (seconds) read endpoints trust a cached is_active flag instead of loading the user
+AUTH_USER_STATE_TIMEOUT = config('AUTH_USER_STATE_TIMEOUT', default=30, cast=int)
+
+# Session-authenticated users: per-process LRU size, how long (seconds) an LRU
+# entry is trusted before it is checked again, and shared cache lifetime
+USER_CACHE_LRU_SIZE = config('USER_CACHE_LRU_SIZE', default=1024, cast=int)
+USER_CACHE_LOCAL_TTL = config('USER_CACHE_LOCAL_TTL', default=5, cast=int)
+USER_CACHE_TIMEOUT = config('USER_CACHE_TIMEOUT', default=300, cast=int)
+
+# Refresh token cleanup (`python manage.py purge_tokens`): revoked tokens are kept
+# this many days for auditing; a purge interval > 0 also runs it in each web process
+REFRESH_TOKEN_REVOKED_RETENTION_DAYS = config('REFRESH_TOKEN_REVOKED_RETENTION_DAYS', default=30, cast=int)
+REFRESH_TOKEN_PURGE_BATCH_SIZE = config('REFRESH_TOKEN_PURGE_BATCH_SIZE', default=1000, cast=int)
+REFRESH_TOKEN_PURGE_INTERVAL = config('REFRESH_TOKEN_PURGE_INTERVAL', default=0, cast=int)
+
+# Bloom filter in front of username/email availability checks: rebuilt every
+# AVAILABILITY_FILTER_REFRESH seconds, sized for twice the current user count
+AVAILABILITY_FILTER_REFRESH = config('AVAILABILITY_FILTER_REFRESH', default=300, cast=int)
+AVAILABILITY_FILTER_ERROR_RATE = config('AVAILABILITY_FILTER_ERROR_RATE', default=0.01, cast=float)
+AVAILABILITY_FILTER_MIN_CAPACITY = config('AVAILABILITY_FILTER_MIN_CAPACITY', default=10000, cast=int)
+
+# bcrypt admission per process: this many hashes at once, this many more
+# waiting; anything beyond is rejected with a 503. Keep the sum below the
+# worker's thread count (GUNICORN_THREADS in the Procfile)
+PASSWORD_HASHING_MAX_CONCURRENCY = config('PASSWORD_HASHING_MAX_CONCURRENCY', default=2, cast=int)
+PASSWORD_HASHING_MAX_QUEUE = config('PASSWORD_HASHING_MAX_QUEUE', default=4, cast=int)
+
+# bcrypt work factor for new and rehashed passwords; pick it for the host with
+# `python manage.py calibrate_bcrypt`
+BCRYPT_ROUNDS = config('BCRYPT_ROUNDS', default=12, cast=int)
+
+# Dynamic responses of at least COMPRESSION_MIN_SIZE bytes are sent with
+# Brotli (if installed) or gzip; moderate levels keep per-request CPU low
+COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', default=1024, cast=int)
+COMPRESSION_GZIP_LEVEL = config('COMPRESSION_GZIP_LEVEL', default=6, cast=int)
+COMPRESSION_BROTLI_QUALITY = config('COMPRESSION_BROTLI_QUALITY', default=4, cast=int)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -163,14 +284,32 @@ if not DEBUG:
 # Django REST Framework settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'tracker_app.authentication.DenylistJWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'tracker_app.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    # Rates for tracker_app.throttling; an empty value disables a scope
+    'DEFAULT_THROTTLE_RATES': {
+        'login': config('THROTTLE_RATE_LOGIN', default='20/min'),
+        'login_account': config('THROTTLE_RATE_LOGIN_ACCOUNT', default='5/min'),
+        'register': config('THROTTLE_RATE_REGISTER', default='10/hour'),
+        'refresh': config('THROTTLE_RATE_REFRESH', default='60/min'),
+        'availability': config('THROTTLE_RATE_AVAILABILITY', default='60/min'),
+    },
+    # Trusted reverse proxies in front of the app; X-Forwarded-For is only
+    # used to identify clients for throttling when this is above zero. Behind
+    # a proxy it must be set, or every client shares the proxy's address and
+    # its per-IP limits; the Procfile sets 1 unless the environment says
+    # otherwise
+    'NUM_PROXIES': config('NUM_PROXIES', default=0, cast=int),
 }
 
 # JWT Settings
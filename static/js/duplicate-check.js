@@ -1,85 +1,112 @@
 // Real-time duplicate checking for registration form
 // Add this to your registration template for better user experience
+//
+// Both fields are checked with a single debounced request to
+// /api/check-availability/. In-flight requests are aborted when the user keeps
+// typing, and answers are remembered so retyping a value costs no request.
 
 function checkDuplicateAccount() {
     const usernameField = document.querySelector('input[name="username"]');
     const emailField = document.querySelector('input[name="email"]');
-    
+    if (!usernameField && !emailField) return;
+
+    const answers = new Map();
+    let pending = null;
+    let checkTimeout;
+
     // Create feedback elements
     function createFeedbackElement(field) {
         const existing = field.parentElement.querySelector('.duplicate-feedback');
-        if (existing) existing.remove();
-        
+        if (existing) return existing;
+
         const feedback = document.createElement('div');
         feedback.className = 'duplicate-feedback text-sm mt-1 flex items-center';
         field.parentElement.appendChild(feedback);
         return feedback;
     }
-    
-    // Check username availability
-    if (usernameField) {
-        let usernameTimeout;
-        usernameField.addEventListener('input', function() {
-            clearTimeout(usernameTimeout);
-            const feedback = createFeedbackElement(this);
-            const username = this.value.trim();
-            
-            if (username.length < 3) {
-                feedback.innerHTML = '';
-                return;
+
+    const fields = {
+        username: {
+            input: usernameField,
+            ready: value => value.length >= 3,
+            checking: 'Checking availability...',
+            available: 'Username available',
+            taken: data => data.message,
+        },
+        email: {
+            input: emailField,
+            ready: value => value.includes('@'),
+            checking: 'Checking email...',
+            available: 'Email available',
+            taken: data => data.message + ' - <a href="/login/" class="underline">try logging in</a>',
+        },
+    };
+
+    function render(name, data) {
+        const field = fields[name];
+        const feedback = createFeedbackElement(field.input);
+        if (data.error) {
+            feedback.innerHTML = '';
+        } else if (data.available) {
+            feedback.innerHTML = '<i class="fas fa-check mr-2 text-green-500"></i><span class="text-green-600">' + field.available + '</span>';
+        } else {
+            feedback.innerHTML = '<i class="fas fa-times mr-2 text-red-500"></i><span class="text-red-600">' + field.taken(data) + '</span>';
+        }
+    }
+
+    function runCheck() {
+        const params = new URLSearchParams();
+        for (const [name, field] of Object.entries(fields)) {
+            if (!field.input) continue;
+            const value = field.input.value.trim();
+            if (!field.ready(value)) continue;
+
+            const key = name + ':' + value.toLowerCase();
+            if (answers.has(key)) {
+                render(name, answers.get(key));
+            } else {
+                params.set(name, value);
             }
-            
-            feedback.innerHTML = '<i class="fas fa-spinner fa-spin mr-2 text-gray-400"></i><span class="text-gray-500">Checking availability...</span>';
-            
-            usernameTimeout = setTimeout(() => {
-                fetch(`/api/check-username/?username=${encodeURIComponent(username)}`)
-                    .then(response => response.json())
-                    .then(data => {
-                        if (data.available) {
-                            feedback.innerHTML = '<i class="fas fa-check mr-2 text-green-500"></i><span class="text-green-600">Username available</span>';
-                        } else {
-                            feedback.innerHTML = '<i class="fas fa-times mr-2 text-red-500"></i><span class="text-red-600">' + data.message + '</span>';
-                        }
-                    })
-                    .catch(error => {
-                        feedback.innerHTML = '<i class="fas fa-exclamation-triangle mr-2 text-yellow-500"></i><span class="text-yellow-600">Could not check availability</span>';
-                    });
-            }, 800);
-        });
+        }
+        if (![...params.keys()].length) return;
+
+        if (pending) pending.abort();
+        pending = new AbortController();
+
+        fetch('/api/check-availability/?' + params.toString(), { signal: pending.signal })
+            .then(response => response.json())
+            .then(data => {
+                for (const [name, result] of Object.entries(data)) {
+                    if (!fields[name]) continue;
+                    if (!result.error) answers.set(name + ':' + params.get(name).toLowerCase(), result);
+                    render(name, result);
+                }
+            })
+            .catch(error => {
+                if (error.name === 'AbortError') return;
+                for (const name of params.keys()) {
+                    createFeedbackElement(fields[name].input).innerHTML = '<i class="fas fa-exclamation-triangle mr-2 text-yellow-500"></i><span class="text-yellow-600">Could not check availability</span>';
+                }
+            });
     }
-    
-    // Check email availability
-    if (emailField) {
-        let emailTimeout;
-        emailField.addEventListener('input', function() {
-            clearTimeout(emailTimeout);
+
+    for (const field of Object.values(fields)) {
+        if (!field.input) continue;
+        field.input.addEventListener('input', function() {
+            clearTimeout(checkTimeout);
             const feedback = createFeedbackElement(this);
-            const email = this.value.trim();
-            
-            if (!email.includes('@')) {
+            const value = this.value.trim();
+
+            if (!field.ready(value)) {
                 feedback.innerHTML = '';
                 return;
             }
-            
-            feedback.innerHTML = '<i class="fas fa-spinner fa-spin mr-2 text-gray-400"></i><span class="text-gray-500">Checking email...</span>';
-            
-            emailTimeout = setTimeout(() => {
-                fetch(`/api/check-email/?email=${encodeURIComponent(email)}`)
-                    .then(response => response.json())
-                    .then(data => {
-                        if (data.available) {
-                            feedback.innerHTML = '<i class="fas fa-check mr-2 text-green-500"></i><span class="text-green-600">Email available</span>';
-                        } else {
-                            feedback.innerHTML = '<i class="fas fa-times mr-2 text-red-500"></i><span class="text-red-600">' + data.message + ' - <a href="/login/" class="underline">try logging in</a></span>';
-                        }
-                    })
-                    .catch(error => {
-                        feedback.innerHTML = '<i class="fas fa-exclamation-triangle mr-2 text-yellow-500"></i><span class="text-yellow-600">Could not check availability</span>';
-                    });
-            }, 800);
+
+            feedback.innerHTML = '<i class="fas fa-spinner fa-spin mr-2 text-gray-400"></i><span class="text-gray-500">' + field.checking + '</span>';
+            checkTimeout = setTimeout(runCheck, 500);
         });
     }
 }
 
 // Initialize when DOM is loaded
-document.addEventListener('DOMContentLoaded', checkDuplicateAccount);
\ No newline at end of file
+document.addEventListener('DOMContentLoaded', checkDuplicateAccount);
@@ -52,12 +52,12 @@ class RefreshTokenAdmin(admin.ModelAdmin):
     list_display = ('user', 'created_at', 'expires_at', 'is_revoked', 'device_info', 'ip_address')
     list_filter = ('is_revoked', 'created_at', 'expires_at')
     search_fields = ('user__email', 'user__username', 'device_info', 'ip_address')
-    readonly_fields = ('token', 'created_at')
+    readonly_fields = ('token', 'created_at', 'revoked_at')
     ordering = ('-created_at',)
     
     fieldsets = (
         ('Token Information', {
-            'fields': ('user', 'is_revoked', 'created_at', 'expires_at')
+            'fields': ('user', 'is_revoked', 'revoked_at', 'created_at', 'expires_at')
         }),
         ('Device Information', {
             'fields': ('device_info', 'ip_address')
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from .api_views import (
     CustomTokenObtainPairView,
@@ -8,11 +9,28 @@ from .api_views import (
     PasswordChangeView,
     ApplicationListCreateView,
     ApplicationDetailView,
+    ApplicationBulkView,
+    ApplicationExportView,
+    ApplicationImportView,
+    ApplicationsByStatusView,
     dashboard_stats,
+    search_applications_view,
     user_tokens,
-    revoke_token
+    revoke_token,
+    server_metrics
 )
 
+application_list_create = ApplicationListCreateView.as_view()
+application_detail = ApplicationDetailView.as_view()
+
+if settings.API_ASYNC_VIEWS:
+    # Hot reads are served by async views; writes still go to the DRF views
+    from . import async_views
+    application_list_create = async_views.reads_async(async_views.application_list, application_list_create)
+    application_detail = async_views.reads_async(async_views.application_detail, application_detail)
+    dashboard_stats = async_views.reads_async(async_views.dashboard_stats, dashboard_stats)
+    user_tokens = async_views.reads_async(async_views.user_tokens, user_tokens)
+
 urlpatterns = [
     # Authentication endpoints
     path('auth/login/', CustomTokenObtainPairView.as_view(), name='token_obtain_pair'),
@@ -27,9 +45,17 @@ urlpatterns = [
     path('user/tokens/<int:token_id>/revoke/', revoke_token, name='revoke_token'),
     
     # Applications
-    path('applications/', ApplicationListCreateView.as_view(), name='application_list_create'),
-    path('applications/<uuid:pk>/', ApplicationDetailView.as_view(), name='application_detail'),
+    path('applications/', application_list_create, name='application_list_create'),
+    path('applications/<uuid:pk>/', application_detail, name='application_detail'),
+    path('applications/bulk/', ApplicationBulkView.as_view(), name='application_bulk'),
+    path('applications/export/', ApplicationExportView.as_view(), name='application_export'),
+    path('applications/import/', ApplicationImportView.as_view(), name='application_import'),
+    path('applications/search/', search_applications_view, name='application_search'),
+    path('applications/by-status/<str:status>/', ApplicationsByStatusView.as_view(), name='applications_by_status'),
     
     # Dashboard
     path('dashboard/stats/', dashboard_stats, name='dashboard_stats'),
+
+    # Monitoring
+    path('metrics/', server_metrics, name='server_metrics'),
 ]
\ No newline at end of file
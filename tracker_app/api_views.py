@@ -1,43 +1,122 @@
 from rest_framework import generics, status, permissions
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.parsers import MultiPartParser
+from rest_framework.utils.urls import replace_query_param
 from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.urls import reverse
 from django.utils import timezone
 from datetime import timedelta
 import jwt
+import uuid
 from django.conf import settings
 
 from .models import CustomUser, Application, RefreshToken as CustomRefreshToken
+from .authentication import ClaimsJWTAuthentication
+from .conditional import application_validators, collection_etag, not_modified, set_validators
+from .connection_pools import pool_stats
+from .dashboard import (
+    CARD_ORDERING,
+    aget_dashboard_version,
+    aget_status_counts,
+    build_dashboard,
+    cache_timeout as dashboard_cache_timeout,
+    get_cached_dashboard,
+    get_dashboard_version,
+    get_status_counts,
+)
+from .pagination import ApplicationPagination, KeysetPagination
+from .exporters import CONTENT_TYPES as EXPORT_CONTENT_TYPES, aexport_applications, export_applications
+from .hashing import PasswordHashingBusy
+from .filters import counted_statuses, filter_applications, filters_key, parse_fields, parse_ordering
+from .importers import FORMATS as IMPORT_FORMATS, detect_format, import_applications, iter_records
+from .renderers import CSVRenderer, NDJSONRenderer
+from .search import search_applications
+from .throttling import LoginAccountThrottle, LoginIPThrottle, RefreshIPThrottle, RegisterIPThrottle
+from . import denylist, metrics
 from .serializers import (
     CustomTokenObtainPairSerializer,
     UserRegistrationSerializer,
     UserProfileSerializer,
     ApplicationSerializer,
-    PasswordChangeSerializer
+    ApplicationRecordSerializer,
+    PasswordChangeSerializer,
+    APPLICATION_FIELDS,
 )
 
 
+# Read-mostly endpoints: GETs authenticate from token claims without a user query
+READ_AUTHENTICATION_CLASSES = [ClaimsJWTAuthentication, SessionAuthentication]
+
+
+class SparseFieldsMixin:
+    """
+    ``?fields=a,b`` on GET trims serialized applications to an allowlisted
+    subset of their fields (see ``filters.parse_fields``)
+    """
+
+    def requested_fields(self):
+        if self.request.method not in ('GET', 'HEAD'):
+            return None
+        return parse_fields(self.request.query_params)
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs.setdefault('fields', self.requested_fields())
+        return super().get_serializer(*args, **kwargs)
+
+
+class ApplicationRecordsMixin(SparseFieldsMixin):
+    """
+    List GETs fetch ``values_list`` records of the requested columns and
+    serialize them with ApplicationRecordSerializer; writes keep
+    ApplicationSerializer
+    """
+
+    def reads_records(self):
+        return self.request.method in ('GET', 'HEAD')
+
+    def get_serializer_class(self):
+        if self.reads_records():
+            return ApplicationRecordSerializer
+        return ApplicationSerializer
+
+    def as_records(self, queryset, ordering):
+        """``ordering`` is selected too, for keyset cursors built from the last record"""
+        if not self.reads_records():
+            return queryset
+        return ApplicationRecordSerializer.rows(queryset, self.requested_fields(), extra=ordering)
+
+
 class CustomTokenObtainPairView(TokenObtainPairView):
     """
     Custom token obtain view that uses email instead of username
     """
     serializer_class = CustomTokenObtainPairSerializer
+    throttle_classes = [LoginIPThrottle, LoginAccountThrottle]
 
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         try:
             serializer.is_valid(raise_exception=True)
+        except PasswordHashingBusy:
+            raise
         except Exception as e:
             return Response({'error': 'Invalid credentials'}, status=status.HTTP_401_UNAUTHORIZED)
 
         user = serializer.validated_data['user']
         
         # Create JWT tokens
-        refresh = RefreshToken.for_user(user)
+        refresh = self.get_serializer_class().get_token(user)
         access = refresh.access_token
 
         # Save refresh token in database
@@ -80,6 +159,7 @@ class UserRegistrationView(generics.CreateAPIView):
     queryset = CustomUser.objects.all()
     serializer_class = UserRegistrationSerializer
     permission_classes = [permissions.AllowAny]
+    throttle_classes = [RegisterIPThrottle]
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -87,7 +167,7 @@ class UserRegistrationView(generics.CreateAPIView):
         user = serializer.save()
 
         # Generate tokens for the new user
-        refresh = RefreshToken.for_user(user)
+        refresh = CustomTokenObtainPairSerializer.get_token(user)
         access = refresh.access_token
 
         # Save refresh token in database
@@ -115,6 +195,8 @@ class CustomTokenRefreshView(TokenRefreshView):
     """
     Custom token refresh view that validates against database
     """
+    throttle_classes = [RefreshIPThrottle]
+
     def post(self, request, *args, **kwargs):
         refresh_token = request.data.get('refresh')
         
@@ -124,7 +206,9 @@ class CustomTokenRefreshView(TokenRefreshView):
 
         # Check if token exists in database and is not revoked
         try:
-            stored_token = CustomRefreshToken.objects.get(token=refresh_token, is_revoked=False)
+            stored_token = CustomRefreshToken.objects.get(
+                token_digest=CustomRefreshToken.digest(refresh_token), is_revoked=False
+            )
             if stored_token.is_expired():
                 stored_token.revoke()
                 return Response({'error': 'Token has expired'}, 
@@ -162,18 +246,22 @@ class CustomTokenRefreshView(TokenRefreshView):
 
 class LogoutView(APIView):
     """
-    Logout view that revokes refresh tokens
+    Logout view that revokes refresh tokens and the current access token
     """
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
         refresh_token = request.data.get('refresh')
         
+        # Deny the access token used for this request until it expires
+        if request.auth is not None:
+            denylist.revoke_access_token(request.auth.payload)
+
         if refresh_token:
             # Revoke specific token
             try:
                 stored_token = CustomRefreshToken.objects.get(
-                    token=refresh_token, 
+                    token_digest=CustomRefreshToken.digest(refresh_token),
                     user=request.user,
                     is_revoked=False
                 )
@@ -185,7 +273,8 @@ class LogoutView(APIView):
             CustomRefreshToken.objects.filter(
                 user=request.user, 
                 is_revoked=False
-            ).update(is_revoked=True)
+            ).update(is_revoked=True, revoked_at=timezone.now())
+            denylist.revoke_user_tokens(request.user.pk)
 
         return Response({'message': 'Logged out successfully'})
 
@@ -214,103 +303,497 @@ class PasswordChangeView(APIView):
             user.set_password(serializer.validated_data['new_password'])
             user.save()
             
-            # Revoke all refresh tokens to force re-login
+            # Revoke all refresh and access tokens to force re-login
             CustomRefreshToken.objects.filter(
                 user=user, 
                 is_revoked=False
-            ).update(is_revoked=True)
+            ).update(is_revoked=True, revoked_at=timezone.now())
+            denylist.revoke_user_tokens(user.pk)
             
             return Response({'message': 'Password changed successfully'})
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class ApplicationListCreateView(generics.ListCreateAPIView):
+def filtered_count_key(user_id, version, params, validator=None):
+    return f'applications:count:{user_id}:{version}:{validator or ""}:{filters_key(params)}'
+
+
+class ApplicationListCreateView(ApplicationRecordsMixin, generics.ListCreateAPIView):
     """
     List and create applications
+
+    Filters: ``status`` (comma separated), ``location``, ``applied_from``/
+    ``applied_to`` and ``interview_from``/``interview_to``. Sort with
+    ``ordering`` (applied_date, interview_date, company_name, updated_at or
+    created_at; prefix ``-`` for descending).
+
+    Paginated by page number by default; ``?pagination=cursor`` switches to
+    keyset pagination on the chosen ordering.
     """
     serializer_class = ApplicationSerializer
+    authentication_classes = READ_AUTHENTICATION_CLASSES
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ApplicationPagination
+    # Collection ETag of the current list request; part of the count cache key
+    validator = None
+
+    def get_ordering(self):
+        return parse_ordering(self.request.query_params)
+
+    @property
+    def keyset_ordering(self):
+        ordering = self.get_ordering()
+        if ordering[0].lstrip('-') == 'interview_date':
+            # Nullable columns cannot be compared in a seek predicate
+            raise ValidationError({'ordering': ['interview_date ordering is not available with cursor pagination']})
+        return ordering
 
     def get_queryset(self):
-        return Application.objects.filter(user=self.request.user)
+        applications = Application.objects.filter(user_id=self.request.user.pk)
+        applications = filter_applications(applications, self.request.query_params)
+        ordering = self.get_ordering()
+        return self.as_records(applications.order_by(*ordering), ordering)
+
+    def get_total_count(self, queryset):
+        statuses = counted_statuses(self.request.query_params)
+        if statuses is not None:
+            # Served from the status counter table rather than COUNT(*)
+            counts = get_status_counts(self.request.user)
+            return sum(counts[code] for code in statuses)
+
+        # Other filters: count once per data version and reuse until the next write
+        key = filtered_count_key(
+            self.request.user.pk,
+            get_dashboard_version(self.request.user.pk),
+            self.request.query_params,
+            self.validator,
+        )
+        total = cache.get(key)
+        if total is None:
+            total = queryset.order_by().count()
+            cache.set(key, total, dashboard_cache_timeout())
+        return total
+
+    async def aget_total_count(self, queryset):
+        """Async version of ``get_total_count``, used by ``async_views.application_list``"""
+        statuses = counted_statuses(self.request.query_params)
+        if statuses is not None:
+            counts = await aget_status_counts(self.request.user)
+            return sum(counts[code] for code in statuses)
+
+        key = filtered_count_key(
+            self.request.user.pk,
+            await aget_dashboard_version(self.request.user.pk),
+            self.request.query_params,
+            self.validator,
+        )
+        total = await cache.aget(key)
+        if total is None:
+            total = await queryset.order_by().acount()
+            await cache.aset(key, total, dashboard_cache_timeout())
+        return total
+
+    def list(self, request, *args, **kwargs):
+        etag = self.validator = collection_etag(request, 'applications')
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        return set_validators(super().list(request, *args, **kwargs), etag)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
 
-class ApplicationDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ApplicationDetailView(SparseFieldsMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     Retrieve, update and delete applications
+
+    ``?fields=`` on GET loads only the requested columns with ``.only()``.
     """
     serializer_class = ApplicationSerializer
+    authentication_classes = READ_AUTHENTICATION_CLASSES
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
-        return Application.objects.filter(user=self.request.user)
+        applications = Application.objects.filter(user_id=self.request.user.pk)
+        fields = self.requested_fields()
+        if fields is None:
+            return applications.select_related('user')
+        if 'user' in fields:
+            # A deferred relation cannot be traversed by select_related
+            applications = applications.select_related('user')
+        return applications.only(*(APPLICATION_FIELDS[name] for name in fields))
+
+    def retrieve(self, request, *args, **kwargs):
+        etag, last_modified = application_validators(request, kwargs['pk'])
+        if etag is not None:
+            response = not_modified(request, etag, last_modified)
+            if response is not None:
+                return response
+        return set_validators(super().retrieve(request, *args, **kwargs), etag, last_modified)
+
+
+class ApplicationBulkView(APIView):
+    """
+    Apply a batch of create/update/delete operations in one transaction
+
+    Body: ``{"operations": [{"op": "create", "data": {...}},
+    {"op": "update", "id": "<uuid>", "data": {...}}, {"op": "delete", "id": "<uuid>"}]}``.
+    Every operation is validated first; if any fails nothing is applied and
+    the per-item results carry the errors.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    operations = ('create', 'update', 'delete')
+
+    def post(self, request):
+        operations = request.data.get('operations') if isinstance(request.data, dict) else None
+        if not isinstance(operations, list) or not operations:
+            return Response({'error': 'operations must be a non-empty list'},
+                          status=status.HTTP_400_BAD_REQUEST)
+
+        max_operations = settings.APPLICATIONS_BULK_MAX_OPERATIONS
+        if len(operations) > max_operations:
+            return Response({'error': f'At most {max_operations} operations are allowed per request'},
+                          status=status.HTTP_400_BAD_REQUEST)
+
+        # Load every application the batch refers to with a single query
+        referenced_ids = {
+            self.normalize_id(operation.get('id'))
+            for operation in operations
+            if isinstance(operation, dict)
+        }
+        referenced_ids.discard(None)
+        instances = {
+            str(application.pk): application
+            for application in Application.objects.filter(
+                user=request.user, pk__in=referenced_ids
+            ).select_related('user')
+        }
+
+        results, to_create, to_update, to_delete = self.validate_operations(operations, instances)
+        if any(result['status'] == 'error' for result in results):
+            # Nothing was applied, so the valid items report their status only
+            for result in results:
+                result.pop('instance', None)
+            return Response({'results': results}, status=status.HTTP_400_BAD_REQUEST)
+
+        updated_fields = {'updated_at'}
+        now = timezone.now()
+        for application, changed_fields in to_update:
+            application.updated_at = now
+            updated_fields.update(changed_fields)
+
+        with transaction.atomic():
+            if to_create:
+                Application.objects.bulk_create([application for _, application in to_create])
+            if to_update:
+                Application.objects.bulk_update(
+                    [application for application, _ in to_update], sorted(updated_fields)
+                )
+            if to_delete:
+                Application.objects.filter(user=request.user, pk__in=to_delete).delete()
+
+        for result in results:
+            if result['status'] in ('created', 'updated'):
+                result['data'] = ApplicationSerializer(result.pop('instance')).data
+
+        return Response({'results': results})
+
+    def validate_operations(self, operations, instances):
+        results = []
+        to_create, to_update, to_delete = [], [], []
+        seen_ids = set()
+
+        for index, operation in enumerate(operations):
+            result = {'index': index}
+            results.append(result)
+
+            op = operation.get('op') if isinstance(operation, dict) else None
+            result['op'] = op
+            if op not in self.operations:
+                result.update(status='error', errors={'op': [f'Must be one of: {", ".join(self.operations)}']})
+                continue
+
+            if op == 'create':
+                serializer = ApplicationSerializer(data=operation.get('data') or {})
+                if not serializer.is_valid():
+                    result.update(status='error', errors=serializer.errors)
+                    continue
+                application = Application(user=self.request.user, **serializer.validated_data)
+                to_create.append((index, application))
+                result.update(status='created', id=str(application.pk), instance=application)
+                continue
+
+            application_id = self.normalize_id(operation.get('id'))
+            result['id'] = operation.get('id')
+            if application_id is None:
+                result.update(status='error', errors={'id': ['A valid application id is required']})
+                continue
+            if application_id in seen_ids:
+                result.update(status='error', errors={'id': ['Appears more than once in this batch']})
+                continue
+            seen_ids.add(application_id)
+
+            application = instances.get(application_id)
+            if application is None:
+                result.update(status='error', errors={'id': ['Application not found']})
+                continue
+
+            if op == 'delete':
+                to_delete.append(application.pk)
+                result['status'] = 'deleted'
+                continue
+
+            serializer = ApplicationSerializer(application, data=operation.get('data') or {}, partial=True)
+            if not serializer.is_valid():
+                result.update(status='error', errors=serializer.errors)
+                continue
+            for field, value in serializer.validated_data.items():
+                setattr(application, field, value)
+            to_update.append((application, serializer.validated_data.keys()))
+            result.update(status='updated', instance=application)
+
+        return results, to_create, to_update, to_delete
+
+    @staticmethod
+    def normalize_id(value):
+        try:
+            return str(uuid.UUID(str(value)))
+        except (TypeError, ValueError):
+            return None
+
+
+class ApplicationExportView(APIView):
+    """
+    Stream the user's applications as CSV or NDJSON
+
+    ``?format=csv|ndjson`` (or the Accept header) picks the encoding;
+    ``status``, ``applied_from`` and ``applied_to`` narrow the rows.
+    Under ASGI the rows are streamed from an async iterator, since Django
+    buffers a sync one in full before sending it.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [CSVRenderer, NDJSONRenderer]
+
+    def get(self, request):
+        export_format = request.accepted_renderer.format
+        queryset = filter_applications(
+            Application.objects.filter(user=request.user),
+            request.query_params
+        )
+
+        exporter = aexport_applications if isinstance(request._request, ASGIRequest) else export_applications
+        response = StreamingHttpResponse(
+            exporter(queryset, export_format),
+            content_type=EXPORT_CONTENT_TYPES[export_format]
+        )
+        filename = f'applications-{timezone.now():%Y%m%d}.{export_format}'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+class ApplicationImportView(APIView):
+    """
+    Import applications from an uploaded CSV, NDJSON or JSON file
+
+    Upload the file as multipart field ``file``; the format comes from the
+    ``format`` field or the file extension. Valid rows are inserted in
+    batches and invalid rows are reported by row number.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'error': 'A file upload is required'},
+                          status=status.HTTP_400_BAD_REQUEST)
+
+        file_format = request.data.get('format') or detect_format(upload.name)
+        if file_format not in IMPORT_FORMATS:
+            return Response({'error': f'format must be one of: {", ".join(IMPORT_FORMATS)}'},
+                          status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            result = import_applications(iter_records(upload.file, file_format), owner=request.user)
+        except (ValueError, UnicodeDecodeError) as e:
+            return Response({'error': f'Could not read file: {e}'},
+                          status=status.HTTP_400_BAD_REQUEST)
+
+        response_status = status.HTTP_201_CREATED if result.created else status.HTTP_400_BAD_REQUEST
+        return Response(result.as_dict(), status=response_status)
 
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
+def search_applications_view(request):
+    """
+    Ranked full-text search over company, role, location and notes
+
+    ``?q=`` holds the search terms; ``page`` and ``page_size`` page through
+    the ranked results.
+    """
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response({'error': 'q is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        page = max(int(request.query_params.get('page', 1)), 1)
+        page_size = int(request.query_params.get('page_size', settings.REST_FRAMEWORK['PAGE_SIZE']))
+    except ValueError:
+        return Response({'error': 'page and page_size must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+    page_size = max(1, min(page_size, 100))
+
+    # Fetch one extra row to know whether another page exists
+    offset = (page - 1) * page_size
+    results = search_applications(request.user, query, limit=page_size + 1, offset=offset)
+    has_next = len(results) > page_size
+    results = results[:page_size]
+
+    url = request.build_absolute_uri()
+    return Response({
+        'next': replace_query_param(url, 'page', page + 1) if has_next else None,
+        'previous': replace_query_param(url, 'page', page - 1) if page > 1 else None,
+        'results': ApplicationSerializer(results, many=True).data,
+    })
+
+
+class ApplicationsByStatusView(ApplicationRecordsMixin, generics.ListAPIView):
+    """
+    Page through a single Kanban column with keyset pagination
+    """
+    serializer_class = ApplicationSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    def get_status_code(self):
+        status_code = self.kwargs['status'].upper()
+        if status_code not in dict(Application.STATUS_CHOICES):
+            raise NotFound('Unknown status')
+        return status_code
+
+    def get_queryset(self):
+        return self.as_records(Application.objects.filter(
+            user=self.request.user,
+            status=self.get_status_code()
+        ), KeysetPagination.ordering)
+
+    def get_total_count(self, queryset):
+        return get_status_counts(self.request.user)[self.get_status_code()]
+
+
+@api_view(['GET'])
+@authentication_classes(READ_AUTHENTICATION_CLASSES)
+@permission_classes([permissions.IsAuthenticated])
 def dashboard_stats(request):
     """
     Dashboard statistics API
+
+    Returns every status count plus the first ``?cards=N`` cards of each
+    column (default ``DASHBOARD_CARDS_PER_COLUMN``), trimmed to ``?fields=``
+    when given. Columns with more cards link to the per-status endpoint to
+    load the rest. Answers 304 when ``If-None-Match`` matches the current
+    ETag.
+    """
+    cards_per_column = parse_cards_per_column(request.query_params)
+    if cards_per_column is None:
+        return Response({'error': 'cards must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+    fields = parse_fields(request.query_params)
+
+    variant = dashboard_variant(cards_per_column, fields)
+    etag = collection_etag(request, f'dashboard:{variant}')
+    response = not_modified(request, etag)
+    if response is not None:
+        return response
+
+    dashboard = get_cached_dashboard(
+        request.user, f'api:{variant}', dashboard_builder(request.user, cards_per_column, fields), etag
+    )
+    return set_validators(Response(dashboard_payload(request, dashboard, fields)), etag)
+
+
+def parse_cards_per_column(params):
+    """Cards per column requested with ``?cards=``, clamped; None if it is not an integer"""
+    if not params.get('cards'):
+        return settings.DASHBOARD_CARDS_PER_COLUMN
+    try:
+        cards_per_column = int(params['cards'])
+    except ValueError:
+        return None
+    return max(0, min(cards_per_column, settings.DASHBOARD_MAX_CARDS_PER_COLUMN))
+
+
+def dashboard_variant(cards_per_column, fields):
+    """Name for one shape of the dashboard payload, for ETags and cache keys"""
+    if fields is None:
+        return str(cards_per_column)
+    return f'{cards_per_column}:{",".join(fields)}'
+
+
+def dashboard_builder(user, cards_per_column, fields=None):
+    return lambda: build_dashboard(
+        user,
+        serialize=lambda records: ApplicationRecordSerializer(records, many=True, fields=fields).data,
+        cards_per_column=cards_per_column,
+        # Grouping and column cursors read the status and card ordering
+        records=lambda applications: ApplicationRecordSerializer.rows(
+            applications, fields, extra=('status', *CARD_ORDERING)
+        ),
+    )
+
+
+def dashboard_payload(request, dashboard, fields=None):
+    """
+    Turn each column's ``next_cursor`` into a link to the per-status
+    endpoint, which keeps the requested ``fields``
     """
-    user = request.user
-    applications = Application.objects.filter(user=user)
-    
-    # Group applications by status
     status_groups = {}
-    for choice in Application.STATUS_CHOICES:
-        status_code, status_name = choice
-        status_applications = applications.filter(status=status_code)
-        status_groups[status_code] = {
-            'name': status_name,
-            'count': status_applications.count(),
-            'applications': ApplicationSerializer(status_applications, many=True).data
-        }
-    
-    # Calculate stats
-    total_applications = applications.count()
-    total_interviews = applications.filter(status__in=['INTERVIEW', 'OFFER']).count()
-    total_offers = applications.filter(status='OFFER').count()
-    success_rate = (total_offers / total_applications * 100) if total_applications > 0 else 0
-    
-    return Response({
-        'status_groups': status_groups,
-        'stats': {
-            'total_applications': total_applications,
-            'total_interviews': total_interviews,
-            'total_offers': total_offers,
-            'success_rate': round(success_rate, 1),
-        }
-    })
+    for status_code, group in dashboard['status_groups'].items():
+        group = dict(group)
+        next_cursor = group.pop('next_cursor', None)
+        group['next'] = None
+        if next_cursor:
+            url = request.build_absolute_uri(reverse('applications_by_status', args=[status_code]))
+            if fields is not None:
+                url = replace_query_param(url, 'fields', ','.join(fields))
+            group['next'] = replace_query_param(url, 'cursor', next_cursor)
+        status_groups[status_code] = group
+    return {'status_groups': status_groups, 'stats': dashboard['stats']}
 
 
 @api_view(['GET'])
+@authentication_classes(READ_AUTHENTICATION_CLASSES)
 @permission_classes([permissions.IsAuthenticated])
 def user_tokens(request):
     """
     Get user's active refresh tokens
+
+    Revoked and expired tokens are filtered out in the query, which is served
+    by the (user, is_revoked, expires_at) index.
     """
-    tokens = CustomRefreshToken.objects.filter(
-        user=request.user, 
-        is_revoked=False
-    ).order_by('-created_at')
-    
-    token_data = []
-    for token in tokens:
-        token_data.append({
-            'id': token.id,
-            'created_at': token.created_at,
-            'expires_at': token.expires_at,
-            'device_info': token.device_info,
-            'ip_address': token.ip_address,
-            'is_expired': token.is_expired()
-        })
-    
+    token_data = [token_payload(token) for token in active_tokens(request.user)]
     return Response({'tokens': token_data})
 
 
+def active_tokens(user):
+    return CustomRefreshToken.objects.filter(
+        user_id=user.pk,
+        is_revoked=False,
+        expires_at__gt=timezone.now()
+    ).order_by('-created_at')
+
+
+def token_payload(token):
+    return {
+        'id': token.id,
+        'created_at': token.created_at,
+        'expires_at': token.expires_at,
+        'device_info': token.device_info,
+        'ip_address': token.ip_address,
+        'is_expired': token.is_expired()
+    }
+
+
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def revoke_token(request, token_id):
@@ -326,4 +809,14 @@ def revoke_token(request, token_id):
         token.revoke()
         return Response({'message': 'Token revoked successfully'})
     except CustomRefreshToken.DoesNotExist:
-        return Response({'error': 'Token not found'}, status=status.HTTP_404_NOT_FOUND)
\ No newline at end of file
+        return Response({'error': 'Token not found'}, status=status.HTTP_404_NOT_FOUND)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+def server_metrics(request):
+    """
+    In-process counters and timings for this worker (staff only), plus the
+    state of its database connection pools
+    """
+    return Response({**metrics.snapshot(), 'database_pools': pool_stats()})
@@ -1,5 +1,14 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.signals import request_started
 
 
 class TrackerAppConfig(AppConfig):
     name = 'tracker_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        if settings.REFRESH_TOKEN_PURGE_INTERVAL > 0:
+            from .token_reaper import start_periodic_purge
+            request_started.connect(start_periodic_purge, dispatch_uid='tracker_app.token_reaper')
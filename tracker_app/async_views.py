@@ -0,0 +1,187 @@
+"""
+Async versions of the hot read endpoints.
+
+Routed instead of the sync views when ``API_ASYNC_VIEWS`` is on, which
+``asgi.py`` turns on by default. Under ASGI the event loop keeps serving other
+requests while one waits on the database: queries made through the async ORM
+and cache APIs run in the request's own worker thread, so a slow round trip
+holds up only the request that issued it. Serializing a page of rows runs in
+a thread pool, off the event loop.
+
+Only GET and HEAD are async. Other methods on the same URLs go to the DRF
+views unchanged (see ``reads_async``). The async views answer in JSON only,
+with the same payloads, status codes and validators as the DRF views.
+"""
+import functools
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import APIException, AuthenticationFailed, NotAuthenticated, NotFound
+from rest_framework.request import Request
+
+from . import availability
+from .api_views import (
+    ApplicationDetailView,
+    ApplicationListCreateView,
+    active_tokens,
+    dashboard_builder,
+    dashboard_payload,
+    dashboard_variant,
+    parse_cards_per_column,
+    token_payload,
+)
+from .authentication import aauthenticate
+from .conditional import aapplication_validators, acollection_etag, not_modified, set_validators
+from .dashboard import aget_cached_dashboard
+from .filters import parse_fields
+from .renderers import ORJSONRenderer
+from .throttling import throttle
+
+
+JSON_MEDIA_TYPE = 'application/json'
+renderer = ORJSONRenderer()
+
+
+def api_response(data, status=200):
+    return HttpResponse(renderer.render(data), status=status, content_type=JSON_MEDIA_TYPE)
+
+
+def error_response(exc):
+    """Render an APIException the way DRF's exception handler does"""
+    data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+    response = api_response(data, exc.status_code)
+    if isinstance(exc, (NotAuthenticated, AuthenticationFailed)):
+        response.status_code = 401
+        response['WWW-Authenticate'] = 'Bearer realm="api"'
+    return response
+
+
+def async_api_view(view_func):
+    """Authenticate like READ_AUTHENTICATION_CLASSES, require a user and render API errors"""
+    @functools.wraps(view_func)
+    async def wrapped(request, *args, **kwargs):
+        try:
+            user = await aauthenticate(request)
+            if user is None:
+                raise NotAuthenticated()
+            request.user = user
+            # Part of every validator; the DRF views negotiate the same type for JSON clients
+            request.accepted_media_type = JSON_MEDIA_TYPE
+            return await view_func(request, *args, **kwargs)
+        except APIException as exc:
+            return error_response(exc)
+    return wrapped
+
+
+def reads_async(async_view, sync_view):
+    """Serve GET and HEAD with ``async_view`` and every other method with the DRF ``sync_view``"""
+    sync_handler = sync_to_async(sync_view)
+
+    async def view(request, *args, **kwargs):
+        if request.method in ('GET', 'HEAD'):
+            return await async_view(request, *args, **kwargs)
+        return await sync_handler(request, *args, **kwargs)
+
+    # DRF views enforce CSRF themselves for session-authenticated writes
+    return csrf_exempt(functools.wraps(async_view)(view))
+
+
+def drf_view(view_class, request, **kwargs):
+    """
+    Instantiate a DRF view for its queryset, pagination and serializer
+    helpers, none of which touch the database until evaluated
+    """
+    drf_request = Request(request)
+    drf_request.user = request.user
+    return view_class(request=drf_request, args=(), kwargs=kwargs, format_kwarg=None)
+
+
+async def serialize(view, rows):
+    # Rows are fully loaded (records carry the user's email), so this is CPU only
+    return await sync_to_async(lambda: view.get_serializer(rows, many=True).data, thread_sensitive=False)()
+
+
+@async_api_view
+async def application_list(request):
+    etag = await acollection_etag(request, 'applications')
+    response = not_modified(request, etag)
+    if response is not None:
+        return response
+
+    view = drf_view(ApplicationListCreateView, request)
+    view.validator = etag
+    queryset = view.get_queryset()
+    paginator = view.paginator
+    page = await paginator.apaginate_queryset(queryset, view.request, view=view)
+    data = await serialize(view, page)
+    return set_validators(api_response(paginator.get_paginated_response(data).data), etag)
+
+
+@async_api_view
+async def application_detail(request, pk):
+    etag, last_modified = await aapplication_validators(request, pk)
+    if etag is not None:
+        response = not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+
+    view = drf_view(ApplicationDetailView, request, pk=pk)
+    application = await view.get_queryset().filter(pk=pk).afirst()
+    if application is None:
+        raise NotFound('No Application matches the given query.')
+    return set_validators(api_response(view.get_serializer(application).data), etag, last_modified)
+
+
+@async_api_view
+async def dashboard_stats(request):
+    cards_per_column = parse_cards_per_column(request.GET)
+    if cards_per_column is None:
+        return api_response({'error': 'cards must be an integer'}, status=400)
+
+    fields = parse_fields(request.GET)
+
+    variant = dashboard_variant(cards_per_column, fields)
+    etag = await acollection_etag(request, f'dashboard:{variant}')
+    response = not_modified(request, etag)
+    if response is not None:
+        return response
+
+    dashboard = await aget_cached_dashboard(
+        request.user, f'api:{variant}', dashboard_builder(request.user, cards_per_column, fields), etag
+    )
+    return set_validators(api_response(dashboard_payload(request, dashboard, fields)), etag)
+
+
+@async_api_view
+async def user_tokens(request):
+    token_data = [token_payload(token) async for token in active_tokens(request.user)]
+    return api_response({'tokens': token_data})
+
+
+@require_GET
+@throttle('availability')
+async def check_username_availability(request):
+    status, payload = await availability.acheck_username(request.GET.get('username'))
+    return JsonResponse(payload, status=status)
+
+
+@require_GET
+@throttle('availability')
+async def check_email_availability(request):
+    status, payload = await availability.acheck_email(request.GET.get('email'))
+    return JsonResponse(payload, status=status)
+
+
+@require_GET
+@throttle('availability')
+async def check_availability(request):
+    checks = {'username': availability.acheck_username, 'email': availability.acheck_email}
+    results = {}
+    for field, check in checks.items():
+        if field in request.GET:
+            results[field] = (await check(request.GET[field]))[1]
+    if not results:
+        return JsonResponse({'error': 'Pass username and/or email'}, status=400)
+    return JsonResponse(results)
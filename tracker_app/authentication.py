@@ -0,0 +1,154 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+
+from . import denylist
+from .models import CustomUser
+from .user_cache import get_cached_user
+
+
+class DenylistJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that also rejects access tokens revoked on logout or
+    password change (see ``tracker_app.denylist``)
+    """
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        if denylist.is_revoked(validated_token.payload):
+            raise InvalidToken('Token has been revoked')
+        return validated_token
+
+
+# Per-user account state consulted by the claims-only fast path. Cached for
+# AUTH_USER_STATE_TIMEOUT seconds and dropped whenever the user row is saved.
+
+def _user_state_key(user_id):
+    return f'auth:user-state:{user_id}'
+
+
+def get_user_state(user_id):
+    """Return ``{'is_active', 'updated_at'}`` for a user, or None if the user does not exist"""
+    key = _user_state_key(user_id)
+    state = cache.get(key)
+    if state is None:
+        state = CustomUser.objects.filter(pk=user_id).values('is_active', 'updated_at').first()
+        if state is None:
+            return None
+        cache.set(key, state, settings.AUTH_USER_STATE_TIMEOUT)
+    return state
+
+
+async def aget_user_state(user_id):
+    """Async version of ``get_user_state``"""
+    key = _user_state_key(user_id)
+    state = await cache.aget(key)
+    if state is None:
+        state = await CustomUser.objects.filter(pk=user_id).values('is_active', 'updated_at').afirst()
+        if state is None:
+            return None
+        await cache.aset(key, state, settings.AUTH_USER_STATE_TIMEOUT)
+    return state
+
+
+def invalidate_user_state(user_id):
+    cache.delete(_user_state_key(user_id))
+
+
+class ClaimsUser(TokenUser):
+    """
+    Request user built from verified JWT claims.
+
+    ``id``, ``email``, ``username`` and ``is_staff`` come from the token,
+    ``is_active`` and ``updated_at`` from the cached account state. Any other
+    attribute loads the CustomUser row on first access.
+    """
+
+    def __init__(self, token, state):
+        super().__init__(token)
+        self.is_active = state['is_active']
+        self.updated_at = state['updated_at']
+        self._instance = None
+
+    def __str__(self):
+        return self.email or str(self.id)
+
+    @property
+    def instance(self):
+        if self._instance is None:
+            self._instance = get_cached_user(self.id)
+            if self._instance is None:
+                raise CustomUser.DoesNotExist
+        return self._instance
+
+    def __getattr__(self, attr):
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        if attr in self.token:
+            return self.token[attr]
+        return getattr(self.instance, attr)
+
+
+class ClaimsJWTAuthentication(DenylistJWTAuthentication):
+    """
+    Authentication for read-mostly endpoints.
+
+    Safe requests get a ClaimsUser and run no user-table query while the
+    account state is cached; other methods load the full user as usual.
+    """
+
+    def authenticate(self, request):
+        self.claims_only = request.method in SAFE_METHODS
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        if not self.claims_only or 'email' not in validated_token:
+            return super().get_user(validated_token)
+        return claims_user(validated_token, get_user_state(_token_user_id(validated_token)))
+
+
+def _token_user_id(validated_token):
+    try:
+        return validated_token[settings.SIMPLE_JWT['USER_ID_CLAIM']]
+    except KeyError:
+        raise InvalidToken('Token contained no recognizable user identification')
+
+
+def claims_user(validated_token, state):
+    if state is None:
+        raise AuthenticationFailed('User not found', code='user_not_found')
+    if not state['is_active']:
+        raise AuthenticationFailed('User is inactive', code='user_inactive')
+    return ClaimsUser(validated_token, state)
+
+
+async def aauthenticate(request):
+    """
+    Authenticate a safe request to an async view
+
+    Mirrors READ_AUTHENTICATION_CLASSES: a bearer token is checked against the
+    denylist and turned into a ClaimsUser, otherwise the session user is
+    used. Returns None when no credentials were sent and raises
+    AuthenticationFailed when they are invalid.
+    """
+    authenticator = JWTAuthentication()
+    header = authenticator.get_header(request)
+    if header is None:
+        user = await request.auser()
+        return user if user.is_authenticated else None
+
+    raw_token = authenticator.get_raw_token(header)
+    if raw_token is None:
+        return None
+    validated_token = authenticator.get_validated_token(raw_token)
+    if await denylist.ais_revoked(validated_token.payload):
+        raise InvalidToken('Token has been revoked')
+
+    if 'email' not in validated_token:
+        return await sync_to_async(authenticator.get_user)(validated_token)
+    return claims_user(validated_token, await aget_user_state(_token_user_id(validated_token)))
@@ -0,0 +1,212 @@
+"""
+Username and email availability checks.
+
+Lookups are case-insensitive and go through the ``lower`` transform, which
+matches the ``Lower(username)`` and ``Lower(email)`` unique indexes on
+CustomUser.
+
+A per-process Bloom filter of every lower-cased username and email sits in
+front of the database. A miss in the filter proves a value is unused, so
+most "available" answers need no query. A hit may be a false positive
+(about ``AVAILABILITY_FILTER_ERROR_RATE``) and is confirmed with an indexed
+query.
+
+The filter is built on first use and rebuilt every
+``AVAILABILITY_FILTER_REFRESH`` seconds. Users saved in this process are
+added as they are saved. A user registered by another worker can therefore
+be reported as available until the next rebuild, as can users inserted
+with ``bulk_create``. Only the advisory availability endpoints use the
+filter. Registration (the form and the API serializer) passes
+``use_filter=False`` so every check is a query, and the unique constraints
+remain the final guard against concurrent sign-ups.
+"""
+import hashlib
+import math
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db.models.functions import Lower
+
+from . import metrics
+from .models import CustomUser
+
+
+MIN_USERNAME_LENGTH = 3
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing of one BLAKE2b digest"""
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(1, capacity)
+        self.size = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+_lock = threading.Lock()
+_filter = None
+_built_at = 0.0
+
+
+def _username_member(username):
+    return f'u:{username.lower()}'
+
+
+def _email_member(email):
+    return f'e:{email.lower()}'
+
+
+def build_filter():
+    """Build a filter holding every current username and email"""
+    count = CustomUser.objects.count()
+    bloom = BloomFilter(
+        max(count * 2, settings.AVAILABILITY_FILTER_MIN_CAPACITY),
+        settings.AVAILABILITY_FILTER_ERROR_RATE,
+    )
+    rows = CustomUser.objects.order_by().values_list(Lower('username'), Lower('email'))
+    for username, email in rows.iterator(chunk_size=5000):
+        bloom.add(_username_member(username))
+        bloom.add(_email_member(email))
+    return bloom
+
+
+def _filter_is_stale():
+    return _filter is None or time.monotonic() - _built_at >= settings.AVAILABILITY_FILTER_REFRESH
+
+
+def get_filter():
+    global _filter, _built_at
+    bloom = _filter
+    if bloom is not None and not _filter_is_stale():
+        return bloom
+    with _lock:
+        if _filter_is_stale():
+            _filter = build_filter()
+            _built_at = time.monotonic()
+            metrics.incr('availability.filter_builds')
+        return _filter
+
+
+def record_user(user):
+    """Add a saved user's username and email to this process's filter"""
+    bloom = _filter
+    if bloom is not None:
+        bloom.add(_username_member(user.username))
+        bloom.add(_email_member(user.email))
+
+
+def reset():
+    """Drop the filter so it is rebuilt on next use (tests)"""
+    global _filter
+    with _lock:
+        _filter = None
+
+
+def _needs_query(member, bloom):
+    if bloom is not None and member not in bloom:
+        metrics.incr('availability.filter_negatives')
+        return False
+    metrics.incr('availability.db_checks')
+    return True
+
+
+def _taken(member, lookup, value, use_filter):
+    if not _needs_query(member, get_filter() if use_filter else None):
+        return False
+    return CustomUser.objects.filter(**{lookup: value.lower()}).exists()
+
+
+async def _ataken(member, lookup, value, use_filter):
+    bloom = None
+    if use_filter:
+        # Only a (re)build of the filter blocks, so only that runs in a worker thread
+        bloom = await sync_to_async(get_filter)() if _filter_is_stale() else get_filter()
+    if not _needs_query(member, bloom):
+        return False
+    return await CustomUser.objects.filter(**{lookup: value.lower()}).aexists()
+
+
+def username_taken(username, use_filter=True):
+    return _taken(_username_member(username), 'username__lower', username, use_filter)
+
+
+def email_taken(email, use_filter=True):
+    return _taken(_email_member(email), 'email__lower', email, use_filter)
+
+
+async def ausername_taken(username, use_filter=True):
+    return await _ataken(_username_member(username), 'username__lower', username, use_filter)
+
+
+async def aemail_taken(email, use_filter=True):
+    return await _ataken(_email_member(email), 'email__lower', email, use_filter)
+
+
+def _username_error(username):
+    if not username:
+        return 400, {'error': 'Username is required'}
+    if len(username) < MIN_USERNAME_LENGTH:
+        return 400, {'error': f'Username must be at least {MIN_USERNAME_LENGTH} characters'}
+    return None
+
+
+def _username_result(username, taken):
+    return 200, {
+        'available': not taken,
+        'message': f'Username "{username}" is already taken' if taken else 'Username available',
+    }
+
+
+def _email_error(email):
+    if not email:
+        return 400, {'error': 'Email is required'}
+    if '@' not in email:
+        return 400, {'error': 'Invalid email format'}
+    return None
+
+
+def _email_result(email, taken):
+    return 200, {
+        'available': not taken,
+        'message': f'An account with email "{email}" already exists' if taken else 'Email available',
+    }
+
+
+def check_username(username):
+    """Return ``(status_code, payload)`` for a username availability request"""
+    username = (username or '').strip()
+    return _username_error(username) or _username_result(username, username_taken(username))
+
+
+def check_email(email):
+    """Return ``(status_code, payload)`` for an email availability request"""
+    email = (email or '').strip()
+    return _email_error(email) or _email_result(email, email_taken(email))
+
+
+async def acheck_username(username):
+    """Async version of ``check_username``"""
+    username = (username or '').strip()
+    return _username_error(username) or _username_result(username, await ausername_taken(username))
+
+
+async def acheck_email(email):
+    """Async version of ``check_email``"""
+    email = (email or '').strip()
+    return _email_error(email) or _email_result(email, await aemail_taken(email))
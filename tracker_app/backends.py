@@ -1,5 +1,6 @@
 from django.contrib.auth.backends import BaseBackend
 from .models import CustomUser
+from .user_cache import get_cached_user
 
 
 class EmailAuthBackend(BaseBackend):
@@ -24,7 +25,8 @@ class EmailAuthBackend(BaseBackend):
         return None
 
     def get_user(self, user_id):
-        try:
-            return CustomUser.objects.get(pk=user_id)
-        except CustomUser.DoesNotExist:
-            return None
\ No newline at end of file
+        # Served from the versioned user cache; no query while the user is unchanged
+        user = get_cached_user(user_id)
+        if user is None or not user.is_active:
+            return None
+        return user
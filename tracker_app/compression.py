@@ -0,0 +1,126 @@
+"""
+Content negotiation and compression for dynamic responses.
+
+``CompressionMiddleware`` uses these helpers to compress API and page
+responses with Brotli (when the ``brotli`` package is installed) or gzip,
+whichever the client's ``Accept-Encoding`` prefers; Brotli wins ties. Static
+files are left to WhiteNoise, which serves them precompressed.
+
+Only JSON API responses are compressed. HTML pages carry the CSRF token and
+echo user input (e.g. the dashboard's ``?q=``), and compressing a secret next
+to attacker-chosen text lets the compressed size leak the secret (BREACH).
+Responses are also only compressed when it is worth it: at least
+``COMPRESSION_MIN_SIZE`` bytes, not streamed, not already encoded and not
+marked ``no-transform``. Levels come from
+``COMPRESSION_GZIP_LEVEL`` and ``COMPRESSION_BROTLI_QUALITY``; the defaults
+trade a little ratio for much less CPU than the maximum levels, which is the
+right call for payloads compressed on every request.
+
+Per encoding, ``compression.<encoding>.responses`` counts compressed
+responses, ``bytes_in``/``bytes_out`` add up sizes (their quotient is the
+overall ratio), and the ``ratio`` and ``cpu_ms`` timings summarise each
+compression.
+"""
+import gzip
+import re
+import time
+
+from django.conf import settings
+
+from . import metrics
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+
+COMPRESSIBLE_TYPES = ('application/json',)
+
+STRONG_ETAG = re.compile(r'^"')
+
+
+def _gzip(content):
+    return gzip.compress(content, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def _brotli(content):
+    return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+
+# Server preference, used to break ties between equally weighted codings
+COMPRESSORS = {'br': _brotli, 'gzip': _gzip} if brotli else {'gzip': _gzip}
+
+
+def parse_accept_encoding(header):
+    """Map each coding named in an Accept-Encoding header to its q-value"""
+    weights = {}
+    for item in header.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding] = quality
+    return weights
+
+
+def negotiate(header):
+    """Return the coding to compress with for an Accept-Encoding header, or None"""
+    weights = parse_accept_encoding(header or '')
+    best, best_quality = None, 0.0
+    for coding in COMPRESSORS:
+        quality = weights.get(coding, weights.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def is_compressible(response):
+    if response.streaming or response.status_code in (204, 304) or response.has_header('Content-Encoding'):
+        return False
+    if 'no-transform' in response.get('Cache-Control', '').lower():
+        return False
+    content_type = response.get('Content-Type', '').split(';')[0].strip().lower()
+    if content_type not in COMPRESSIBLE_TYPES:
+        return False
+    return len(response.content) >= settings.COMPRESSION_MIN_SIZE
+
+
+def compress_response(response, coding):
+    """
+    Replace the body with its ``coding`` encoding, unless that would not make
+    it smaller. Returns whether the response was compressed.
+    """
+    content = response.content
+    started = time.thread_time()
+    compressed = COMPRESSORS[coding](content)
+    cpu_ms = (time.thread_time() - started) * 1000
+
+    metrics.observe(f'compression.{coding}.cpu_ms', cpu_ms)
+    if len(compressed) >= len(content):
+        metrics.incr(f'compression.{coding}.not_smaller')
+        return False
+    metrics.incr(f'compression.{coding}.responses')
+    metrics.incr(f'compression.{coding}.bytes_in', len(content))
+    metrics.incr(f'compression.{coding}.bytes_out', len(compressed))
+    metrics.observe(f'compression.{coding}.ratio', len(compressed) / len(content))
+
+    response.content = compressed
+    response['Content-Length'] = str(len(compressed))
+    response['Content-Encoding'] = coding
+    # The bytes differ from the identity encoding, so a strong validator
+    # would be wrong; If-None-Match still matches weakly (RFC 9110 8.8.3)
+    if response.has_header('ETag'):
+        response['ETag'] = STRONG_ETAG.sub('W/"', response['ETag'])
+    return True
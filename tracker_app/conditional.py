@@ -0,0 +1,117 @@
+"""
+Validators for conditional GETs on the applications and dashboard endpoints.
+
+Validators are computed from indexed columns without loading any rows: a
+user's collection is identified by ``MAX(updated_at)`` and ``COUNT(*)`` over
+the (user, updated_at) index, a single application by its ``updated_at``.
+When the client's ``If-None-Match`` (or, for single applications,
+``If-Modified-Since``) still matches, the view answers 304 before querying
+or serializing anything else.
+
+HTTP dates have one-second resolution, so ``Last-Modified`` is only used once
+its second has passed. Otherwise a client could get the date along with the
+body, and then a 304 with that stale body after an edit later in the same
+second.
+
+Collections only carry an ETag: deleting a row that is not the most recently
+updated one leaves ``MAX(updated_at)`` unchanged, so a Last-Modified date
+could not be trusted, whereas the count in the ETag changes.
+"""
+import hashlib
+import time
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from . import metrics
+from .models import Application
+
+
+def make_etag(*parts):
+    digest = hashlib.md5(
+        '|'.join(str(part) for part in parts).encode('utf-8'), usedforsecurity=False
+    ).hexdigest()
+    return quote_etag(digest)
+
+
+def _representation(request):
+    # The serialized owner (email) and the negotiated media type are part of
+    # every representation, so both feed into the validators
+    user = request.user
+    return (user.pk, user.updated_at, getattr(request, 'accepted_media_type', ''))
+
+
+def _user_applications(request):
+    return Application.objects.filter(user_id=request.user.pk).order_by()
+
+
+def _collection_etag(request, resource, summary):
+    return make_etag(resource, *_representation(request), summary['last_modified'], summary['count'])
+
+
+def collection_etag(request, resource):
+    """ETag for everything under ``resource`` that is derived from the user's applications"""
+    summary = _user_applications(request).aggregate(last_modified=Max('updated_at'), count=Count('pk'))
+    return _collection_etag(request, resource, summary)
+
+
+async def acollection_etag(request, resource):
+    """Async version of ``collection_etag``"""
+    summary = await _user_applications(request).aaggregate(last_modified=Max('updated_at'), count=Count('pk'))
+    return _collection_etag(request, resource, summary)
+
+
+def _application_updated_at(request, pk):
+    return Application.objects.filter(user_id=request.user.pk, pk=pk).values_list('updated_at', flat=True)
+
+
+def _application_validators(request, pk, updated_at):
+    if updated_at is None:
+        return None, None
+    return make_etag('application', pk, *_representation(request), updated_at), updated_at
+
+
+def application_validators(request, pk):
+    """
+    Return ``(etag, last_modified)`` for one of the user's applications, or
+    ``(None, None)`` if it does not exist.
+    """
+    return _application_validators(request, pk, _application_updated_at(request, pk).first())
+
+
+async def aapplication_validators(request, pk):
+    """Async version of ``application_validators``"""
+    return _application_validators(request, pk, await _application_updated_at(request, pk).afirst())
+
+
+def _settled(last_modified):
+    """``last_modified`` if its second is over, so no later edit can share it; else None"""
+    if last_modified and int(last_modified.timestamp()) < int(time.time()):
+        return last_modified
+    return None
+
+
+def not_modified(request, etag=None, last_modified=None):
+    """Return a 304 response if the client's copy is current, otherwise None"""
+    last_modified = _settled(last_modified)
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    # Accepts DRF requests and the plain Django requests of the async views
+    response = get_conditional_response(
+        getattr(request, '_request', request), etag=etag, last_modified=timestamp
+    )
+    if response is None:
+        return None
+    if response.status_code == 304:
+        metrics.incr('conditional_get.not_modified')
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag=None, last_modified=None):
+    if etag and response.status_code in (200, 304):
+        response['ETag'] = etag
+        last_modified = _settled(last_modified)
+        if last_modified:
+            response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
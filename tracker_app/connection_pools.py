@@ -0,0 +1,38 @@
+"""
+Statistics for the psycopg connection pools configured with
+``DATABASE_POOL_MODE=pool`` (see ``placement_tracker_project/database.py``).
+
+The counters are kept by psycopg_pool for the life of the worker process.
+``requests_wait_ms`` is the total time requests spent waiting for a free
+connection, so ``avg_wait_ms`` rising or ``requests_errors`` (checkouts that
+timed out after ``DATABASE_POOL_TIMEOUT``) being non-zero means
+``DATABASE_POOL_MAX_SIZE`` is too small for the worker's concurrency.
+"""
+from django.db import connections
+
+
+def pool_stats():
+    """Return ``{alias: stats}`` for every database served through a connection pool"""
+    stats = {}
+    for connection in connections.all():
+        if not connection.settings_dict.get('OPTIONS', {}).get('pool'):
+            continue
+        pool = getattr(connection, 'pool', None)
+        if pool is None:
+            continue
+        raw = pool.get_stats()
+        requests = raw.get('requests_num', 0)
+        stats[connection.alias] = {
+            'min_size': raw.get('pool_min', 0),
+            'max_size': raw.get('pool_max', 0),
+            'size': raw.get('pool_size', 0),
+            'available': raw.get('pool_available', 0),
+            'waiting': raw.get('requests_waiting', 0),
+            'requests': requests,
+            'requests_queued': raw.get('requests_queued', 0),
+            'requests_errors': raw.get('requests_errors', 0),
+            'requests_wait_ms': raw.get('requests_wait_ms', 0),
+            'avg_wait_ms': round(raw.get('requests_wait_ms', 0) / requests, 3) if requests else 0,
+            'connections_lost': raw.get('connections_lost', 0),
+        }
+    return stats
@@ -0,0 +1,186 @@
+"""
+Maintenance of the denormalized ApplicationStatusCounter table.
+
+Every Application write reports the status it moved from and to. Outside of a
+batch the counter is adjusted immediately, inside the caller's transaction.
+Bulk paths wrap their work in ``application_writes()`` so that per-row changes
+are folded into a single UPDATE per (user, status) when the batch ends.
+"""
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from .dashboard import bump_dashboard_version
+from .models import Application, ApplicationStatusCounter
+
+
+_local = threading.local()
+
+
+class _WriteBatch:
+    def __init__(self):
+        self.deltas = defaultdict(int)
+        self.changed_users = set()
+        self.rebuild_users = set()
+
+
+@contextmanager
+def application_writes():
+    """
+    Collect counter deltas and cache invalidations until the block exits.
+
+    Nested blocks join the outermost batch. Must be used inside the
+    transaction performing the writes so the counters commit with them.
+    """
+    if getattr(_local, 'batch', None) is not None:
+        yield _local.batch
+        return
+
+    batch = _local.batch = _WriteBatch()
+    try:
+        yield batch
+    finally:
+        _local.batch = None
+
+    apply_status_deltas(batch.deltas)
+    if batch.rebuild_users:
+        rebuild_status_counters(batch.rebuild_users)
+    _invalidate_on_commit(batch.changed_users | batch.rebuild_users)
+
+
+@contextmanager
+def suppress_update_tracking():
+    """Let QuerySet.update() run untracked while a caller accounts for it"""
+    _local.suppress_update = True
+    try:
+        yield
+    finally:
+        _local.suppress_update = False
+
+
+def bulk_update_in_progress():
+    return getattr(_local, 'suppress_update', False)
+
+
+def record_status_change(user_id, old_status, new_status):
+    """
+    Account for one application moving from ``old_status`` to ``new_status``.
+
+    ``None`` as the old status means the row was created, ``None`` as the new
+    status means it was deleted.
+    """
+    deltas = {}
+    if old_status != new_status:
+        if old_status is not None:
+            deltas[(user_id, old_status)] = -1
+        if new_status is not None:
+            deltas[(user_id, new_status)] = deltas.get((user_id, new_status), 0) + 1
+
+    batch = getattr(_local, 'batch', None)
+    if batch is None:
+        apply_status_deltas(deltas)
+        _invalidate_on_commit({user_id})
+        return
+
+    for key, delta in deltas.items():
+        batch.deltas[key] += delta
+    batch.changed_users.add(user_id)
+
+
+def mark_changed(user_id):
+    """Record a write that did not change any status"""
+    batch = getattr(_local, 'batch', None)
+    if batch is None:
+        _invalidate_on_commit({user_id})
+    else:
+        batch.changed_users.add(user_id)
+
+
+def schedule_rebuild(user_id):
+    """Recount a user's statuses from the source table (inside a batch: at the end)"""
+    batch = getattr(_local, 'batch', None)
+    if batch is None:
+        rebuild_status_counters([user_id])
+        _invalidate_on_commit({user_id})
+    else:
+        batch.rebuild_users.add(user_id)
+
+
+def apply_status_deltas(deltas):
+    """Apply ``{(user_id, status): delta}`` to the counter table"""
+    for (user_id, status), delta in deltas.items():
+        if not delta:
+            continue
+        counters = ApplicationStatusCounter.objects.filter(user_id=user_id, status=status)
+        if counters.update(count=F('count') + delta):
+            continue
+        if delta < 0:
+            # Nothing to decrement (e.g. the user row is being deleted)
+            continue
+        counter, created = ApplicationStatusCounter.objects.get_or_create(
+            user_id=user_id, status=status, defaults={'count': delta}
+        )
+        if not created:
+            counters.update(count=F('count') + delta)
+
+
+def _invalidate_on_commit(user_ids):
+    for user_id in user_ids:
+        transaction.on_commit(lambda user_id=user_id: bump_dashboard_version(user_id))
+
+
+def count_from_source(user_ids=None):
+    """Count applications per (user, status) straight from the Application table"""
+    applications = Application.objects.all()
+    if user_ids is not None:
+        applications = applications.filter(user_id__in=user_ids)
+    rows = applications.order_by().values('user_id', 'status').annotate(total=Count('pk'))
+    return {(row['user_id'], row['status']): row['total'] for row in rows}
+
+
+def stored_counts(user_ids=None):
+    counters = ApplicationStatusCounter.objects.all()
+    if user_ids is not None:
+        counters = counters.filter(user_id__in=user_ids)
+    return {
+        (user_id, status): count
+        for user_id, status, count in counters.values_list('user_id', 'status', 'count')
+        if count
+    }
+
+
+def rebuild_status_counters(user_ids=None, batch_size=1000):
+    """Replace the stored counters with fresh counts; returns the number of rows written"""
+    with transaction.atomic():
+        counts = count_from_source(user_ids)
+        counters = ApplicationStatusCounter.objects.all()
+        if user_ids is not None:
+            counters = counters.filter(user_id__in=list(user_ids))
+        counters.delete()
+        ApplicationStatusCounter.objects.bulk_create(
+            [
+                ApplicationStatusCounter(user_id=user_id, status=status, count=count)
+                for (user_id, status), count in counts.items()
+            ],
+            batch_size=batch_size,
+        )
+    return len(counts)
+
+
+def verify_status_counters(user_ids=None):
+    """
+    Compare stored counters against the source table.
+
+    Returns a list of ``(user_id, status, stored, actual)`` mismatches.
+    """
+    actual = count_from_source(user_ids)
+    stored = stored_counts(user_ids)
+    mismatches = []
+    for key in sorted(set(actual) | set(stored), key=lambda k: (str(k[0]), k[1])):
+        if actual.get(key, 0) != stored.get(key, 0):
+            mismatches.append((key[0], key[1], stored.get(key, 0), actual.get(key, 0)))
+    return mismatches
+
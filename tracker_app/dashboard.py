@@ -0,0 +1,283 @@
+import threading
+import time
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from . import metrics
+from .models import Application, ApplicationStatusCounter
+from .pagination import KeysetPagination
+
+
+INTERVIEW_STATUSES = ('INTERVIEW', 'OFFER')
+OFFER_STATUSES = ('OFFER',)
+
+# Card order within a column; matches the keyset pagination of the per-status API
+CARD_ORDERING = ('-created_at', '-id')
+
+
+def get_status_counts(user):
+    """
+    Return a user's application count for every status.
+
+    Reads the denormalized ApplicationStatusCounter rows (at most one per
+    status) instead of counting the Application table.
+    """
+    counts = {status_code: 0 for status_code, _ in Application.STATUS_CHOICES}
+    rows = ApplicationStatusCounter.objects.filter(user_id=user.pk).values_list('status', 'count')
+    for status_code, count in rows:
+        counts[status_code] = count
+    return counts
+
+
+async def aget_status_counts(user):
+    """Async version of ``get_status_counts``"""
+    counts = {status_code: 0 for status_code, _ in Application.STATUS_CHOICES}
+    rows = ApplicationStatusCounter.objects.filter(user_id=user.pk).values_list('status', 'count')
+    async for status_code, count in rows:
+        counts[status_code] = count
+    return counts
+
+
+def compute_stats(status_counts):
+    """Derive the dashboard summary numbers from per-status counts"""
+    total_applications = sum(status_counts.values())
+    total_interviews = sum(status_counts.get(code, 0) for code in INTERVIEW_STATUSES)
+    total_offers = sum(status_counts.get(code, 0) for code in OFFER_STATUSES)
+    success_rate = (total_offers / total_applications * 100) if total_applications > 0 else 0
+
+    return {
+        'total_applications': total_applications,
+        'total_interviews': total_interviews,
+        'total_offers': total_offers,
+        'success_rate': round(success_rate, 1),
+    }
+
+
+def get_column_cards(user, cards_per_column=None, records=None):
+    """
+    Fetch a user's cards in column order with one query.
+
+    With ``cards_per_column`` only the first N cards of each status are
+    returned, selected in the database with a ROW_NUMBER() window partitioned
+    by status. ``records`` optionally turns the queryset into lighter rows
+    (e.g. ``ApplicationRecordSerializer.rows``) that expose the same
+    attributes as instances.
+    """
+    applications = Application.objects.filter(user_id=user.pk)
+    if records is None:
+        applications = applications.select_related('user')
+    if cards_per_column is not None:
+        applications = applications.annotate(
+            column_position=Window(
+                RowNumber(),
+                partition_by=[F('status')],
+                order_by=[F('created_at').desc(), F('id').desc()],
+            )
+        ).filter(column_position__lte=cards_per_column)
+    applications = applications.order_by(*CARD_ORDERING)
+    return list(records(applications) if records else applications)
+
+
+def build_dashboard(user, serialize=None, cards_per_column=None, records=None):
+    """
+    Build the Kanban dashboard for a user in a fixed number of queries.
+
+    One query reads every status count from the counter table and one ordered query
+    fetches the cards, which are grouped by status in Python. ``serialize``
+    optionally converts the fetched applications (e.g. into API payloads)
+    before grouping; by default model instances are returned. ``records`` is
+    passed to ``get_column_cards`` to fetch rows for ``serialize`` instead of
+    instances.
+
+    When ``cards_per_column`` is given, each column holds at most that many
+    cards and columns with more rows carry a ``next_cursor`` for the
+    per-status applications endpoint.
+    """
+    status_counts = get_status_counts(user)
+
+    applications = get_column_cards(user, cards_per_column, records)
+    items = serialize(applications) if serialize else applications
+
+    grouped = {status_code: [] for status_code, _ in Application.STATUS_CHOICES}
+    last_card = {}
+    for application, item in zip(applications, items):
+        grouped.setdefault(application.status, []).append(item)
+        last_card[application.status] = application
+
+    status_groups = {}
+    for status_code, status_name in Application.STATUS_CHOICES:
+        status_groups[status_code] = {
+            'name': status_name,
+            'count': status_counts[status_code],
+            'applications': grouped[status_code],
+        }
+        if cards_per_column is not None:
+            next_cursor = None
+            if status_counts[status_code] > len(grouped[status_code]) and status_code in last_card:
+                last = last_card[status_code]
+                next_cursor = KeysetPagination().encode_cursor(
+                    [getattr(last, field.lstrip('-')) for field in CARD_ORDERING]
+                )
+            status_groups[status_code]['next_cursor'] = next_cursor
+
+    return {
+        'status_groups': status_groups,
+        'stats': compute_stats(status_counts),
+    }
+
+
+# Dashboard result cache
+#
+# Payloads are stored under a key that embeds a per-user version. Any write to
+# one of the user's applications replaces the version, so stale payloads are
+# never read again and simply age out of the cache.
+#
+# The API views also put the collection ETag they just computed from the
+# database into the key, so a payload is only served under the validator it
+# was built for. Without a shared cache a version bump only reaches the worker
+# that made the write; there the ETag keeps API payloads current in every
+# worker, and ``cache_timeout()`` caps how long other entries can lag.
+
+_build_locks = {}
+_build_locks_guard = threading.Lock()
+
+
+def _version_key(user_id):
+    return f'dashboard:version:{user_id}'
+
+
+def get_dashboard_version(user_id):
+    """Return the current dashboard version for a user, creating one if needed"""
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(key, version, None):
+            version = cache.get(key, version)
+    return version
+
+
+async def aget_dashboard_version(user_id):
+    """Async version of ``get_dashboard_version``"""
+    key = _version_key(user_id)
+    version = await cache.aget(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not await cache.aadd(key, version, None):
+            version = await cache.aget(key, version)
+    return version
+
+
+def _payload_key(user_id, variant, version, validator=None):
+    key = f'dashboard:{variant}:{user_id}:{version}'
+    return f'{key}:{validator}' if validator else key
+
+
+def cache_timeout():
+    """Lifetime of versioned entries; short when version bumps are per process"""
+    if settings.SHARED_CACHE:
+        return settings.DASHBOARD_CACHE_TIMEOUT
+    return min(settings.DASHBOARD_CACHE_TIMEOUT, settings.DASHBOARD_LOCAL_CACHE_TIMEOUT)
+
+
+def bump_dashboard_version(user_id):
+    """Invalidate every cached dashboard payload for a user"""
+    cache.set(_version_key(user_id), uuid.uuid4().hex, None)
+    metrics.incr('dashboard_cache.invalidations')
+
+
+def _get_build_lock(key):
+    with _build_locks_guard:
+        lock = _build_locks.get(key)
+        if lock is None:
+            lock = _build_locks[key] = threading.Lock()
+        return lock
+
+
+def _release_build_lock(key, lock):
+    with _build_locks_guard:
+        if _build_locks.get(key) is lock:
+            del _build_locks[key]
+
+
+def _wait_for_result(key, timeout):
+    """Poll the cache until another worker stores the result or the lock times out"""
+    deadline = time.monotonic() + timeout
+    interval = 0.01
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        value = cache.get(key)
+        if value is not None:
+            return value
+        interval = min(interval * 2, 0.2)
+    return None
+
+
+def get_cached_dashboard(user, variant, build, validator=None):
+    """
+    Return the dashboard payload for ``user`` from the cache, building it on a miss.
+
+    ``variant`` distinguishes payload shapes (e.g. ``'api'`` and ``'html'``).
+    ``validator`` is the ETag the response will carry, computed before the
+    lookup, so the payload served is never older than it.
+    Concurrent misses for the same key are coalesced: threads in this process
+    wait on a shared lock, and other processes wait on a lock stored in the
+    cache, so only one caller runs ``build`` while the rest reuse its result.
+    """
+    timeout = cache_timeout()
+    lock_timeout = getattr(settings, 'DASHBOARD_CACHE_LOCK_TIMEOUT', 10)
+
+    key = _payload_key(user.pk, variant, get_dashboard_version(user.pk), validator)
+    value = cache.get(key)
+    if value is not None:
+        metrics.incr('dashboard_cache.hits')
+        return value
+
+    metrics.incr('dashboard_cache.misses')
+    local_lock = _get_build_lock(key)
+    with local_lock:
+        value = cache.get(key)
+        if value is not None:
+            metrics.incr('dashboard_cache.coalesced')
+            return value
+
+        lock_key = f'{key}:lock'
+        acquired = cache.add(lock_key, 1, lock_timeout)
+        if not acquired:
+            value = _wait_for_result(key, lock_timeout)
+            if value is not None:
+                metrics.incr('dashboard_cache.coalesced')
+                return value
+
+        try:
+            started = time.perf_counter()
+            value = build()
+            metrics.observe('dashboard_cache.build_ms', (time.perf_counter() - started) * 1000)
+            cache.set(key, value, timeout)
+        finally:
+            if acquired:
+                cache.delete(lock_key)
+            _release_build_lock(key, local_lock)
+
+    return value
+
+
+async def aget_cached_dashboard(user, variant, build, validator=None):
+    """
+    Async version of ``get_cached_dashboard``
+
+    Hits are served with the async cache API. A miss runs the sync version in
+    the request's worker thread, keeping miss coalescing and the build itself
+    off the event loop.
+    """
+    key = _payload_key(user.pk, variant, await aget_dashboard_version(user.pk), validator)
+    value = await cache.aget(key)
+    if value is not None:
+        metrics.incr('dashboard_cache.hits')
+        return value
+    return await sync_to_async(get_cached_dashboard)(user, variant, build, validator)
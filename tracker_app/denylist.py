@@ -0,0 +1,232 @@
+"""
+Revocation denylist for JWT access tokens.
+
+Access tokens are stateless, so logging out or changing a password used to
+leave already-issued access tokens valid until they expired. Revoked tokens
+are now recorded two ways:
+
+* by ``jti``, for a single token (logout of the current session);
+* as a per-user cutoff, for every token issued before it (password change,
+  logout everywhere).
+
+Entries live in a process-local dict and in a shared store, both expiring
+with the token lifetime. A lookup is a dict probe plus, on a local miss, one
+``get_many`` against the store so revocations made by other workers are
+seen. A token found not revoked is then trusted locally for
+``DENYLIST_LOCAL_TTL`` seconds, so a client making many requests pays the
+store round trip (a query, without Redis) once per TTL instead of on every
+request. The price is that a revocation made by another worker can take that
+long to reach this one; revocations made here apply at once.
+
+The store has to be shared by every worker, or a token revoked in one would
+stay valid in the others. It is the Redis cache when ``CACHE_URL`` is set.
+Otherwise it is the ``AccessTokenRevocation`` table, and the lookup is one
+primary-key query. A database cache table would not do: past
+``MAX_ENTRIES`` it culls rows, and a culled revocation is a revoked token
+that works again. Table rows stay until they expire, and the token reaper
+deletes them after that.
+"""
+import datetime
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+from . import metrics
+from .models import AccessTokenRevocation
+
+
+# How often the local dicts are swept for expired entries (seconds)
+PRUNE_INTERVAL = 60
+
+_lock = threading.Lock()
+_revoked_jtis = {}
+_user_cutoffs = {}
+_checked_jtis = {}
+_last_prune = 0.0
+
+
+class DatabaseStore:
+    """The cache methods used by the denylist, backed by AccessTokenRevocation"""
+
+    def set(self, key, value, timeout):
+        AccessTokenRevocation.objects.update_or_create(
+            key=key,
+            defaults={'value': int(value), 'expires_at': timezone.now() + datetime.timedelta(seconds=timeout)},
+        )
+
+    def _live(self, keys):
+        return AccessTokenRevocation.objects.filter(
+            key__in=list(keys), expires_at__gt=timezone.now()
+        ).values_list('key', 'value')
+
+    def get_many(self, keys):
+        return dict(self._live(keys))
+
+    async def aget_many(self, keys):
+        return {key: value async for key, value in self._live(keys)}
+
+    def delete_many(self, keys):
+        AccessTokenRevocation.objects.filter(key__in=list(keys)).delete()
+
+
+_database_store = DatabaseStore()
+
+
+def get_store():
+    if settings.SHARED_CACHE:
+        return caches[settings.DENYLIST_CACHE_ALIAS]
+    return _database_store
+
+
+def _jti_key(jti):
+    return f'denylist:jti:{jti}'
+
+
+def _cutoff_key(user_id):
+    return f'denylist:user:{user_id}'
+
+
+def _access_lifetime():
+    return int(settings.SIMPLE_JWT['ACCESS_TOKEN_LIFETIME'].total_seconds())
+
+
+def _prune(now):
+    global _last_prune
+    if now - _last_prune < PRUNE_INTERVAL:
+        return
+    _last_prune = now
+    for entries in (_revoked_jtis, _user_cutoffs, _checked_jtis):
+        for key in [key for key, (_, expires) in entries.items() if expires <= now]:
+            del entries[key]
+
+
+def _remember(entries, key, value, expires):
+    with _lock:
+        now = time.time()
+        entries[key] = (value, expires)
+        _prune(now)
+
+
+def _local_value(entries, key, now):
+    entry = entries.get(key)
+    if entry is None:
+        return None
+    value, expires = entry
+    if expires <= now:
+        entries.pop(key, None)
+        return None
+    return value
+
+
+def revoke_access_token(payload):
+    """Deny the access token with claims ``payload`` until it expires"""
+    jti = payload.get(settings.SIMPLE_JWT['JTI_CLAIM'])
+    expires_at = payload.get('exp')
+    if jti is None or expires_at is None:
+        return
+    timeout = int(expires_at - time.time())
+    if timeout <= 0:
+        return
+    _remember(_revoked_jtis, jti, True, expires_at)
+    get_store().set(_jti_key(jti), True, timeout)
+    metrics.incr('denylist.revoked_tokens')
+
+
+def revoke_user_tokens(user_id):
+    """
+    Deny every access token issued to ``user_id`` before now.
+
+    Token ``iat`` claims have one-second resolution; tokens issued within the
+    current second stay valid so that a login right after the revocation works.
+    """
+    user_id = str(user_id)
+    cutoff = int(time.time())
+    lifetime = _access_lifetime()
+    _remember(_user_cutoffs, user_id, cutoff, cutoff + lifetime)
+    get_store().set(_cutoff_key(user_id), cutoff, lifetime)
+    metrics.incr('denylist.revoked_users')
+
+
+def _claims(payload):
+    jti = payload.get(settings.SIMPLE_JWT['JTI_CLAIM'])
+    user_id = payload.get(settings.SIMPLE_JWT['USER_ID_CLAIM'])
+    if user_id is not None:
+        user_id = str(user_id)
+
+    # One round trip for both keys; a cutoff is compared with the local copy
+    # because a later revocation may have been made by another worker
+    keys = {}
+    if jti is not None:
+        keys['jti'] = _jti_key(jti)
+    if user_id is not None:
+        keys['cutoff'] = _cutoff_key(user_id)
+    return jti, user_id, keys
+
+
+def _revoked_by(payload, jti, user_id, keys, found, now):
+    if jti is not None and found.get(keys['jti']):
+        _remember(_revoked_jtis, jti, True, payload.get('exp', now + _access_lifetime()))
+        return True
+
+    if user_id is not None:
+        cutoffs = [
+            cutoff for cutoff in (_local_value(_user_cutoffs, user_id, now), found.get(keys['cutoff']))
+            if cutoff is not None
+        ]
+        if cutoffs and payload.get('iat', 0) < max(cutoffs):
+            return True
+
+    return False
+
+
+def _recently_checked(jti, now):
+    return jti is not None and _local_value(_checked_jtis, jti, now)
+
+
+def _mark_checked(payload, jti, revoked, now):
+    ttl = settings.DENYLIST_LOCAL_TTL
+    if revoked or jti is None or ttl <= 0:
+        return
+    _remember(_checked_jtis, jti, True, min(now + ttl, payload.get('exp', now + ttl)))
+
+
+def is_revoked(payload):
+    """Return True if the access token with claims ``payload`` has been revoked"""
+    now = time.time()
+    jti, user_id, keys = _claims(payload)
+    if jti is not None and _local_value(_revoked_jtis, jti, now):
+        return True
+    if _recently_checked(jti, now):
+        # Only this worker's own revocations since the last lookup apply
+        return _revoked_by(payload, jti, user_id, keys, {}, now)
+    found = get_store().get_many(keys.values()) if keys else {}
+    revoked = _revoked_by(payload, jti, user_id, keys, found, now)
+    _mark_checked(payload, jti, revoked, now)
+    return revoked
+
+
+async def ais_revoked(payload):
+    """Async version of ``is_revoked``"""
+    now = time.time()
+    jti, user_id, keys = _claims(payload)
+    if jti is not None and _local_value(_revoked_jtis, jti, now):
+        return True
+    if _recently_checked(jti, now):
+        return _revoked_by(payload, jti, user_id, keys, {}, now)
+    found = await get_store().aget_many(keys.values()) if keys else {}
+    revoked = _revoked_by(payload, jti, user_id, keys, found, now)
+    _mark_checked(payload, jti, revoked, now)
+    return revoked
+
+
+def clear():
+    """Forget local entries (tests and benchmarks)"""
+    global _last_prune
+    with _lock:
+        _revoked_jtis.clear()
+        _user_cutoffs.clear()
+        _checked_jtis.clear()
+        _last_prune = 0.0
@@ -0,0 +1,141 @@
+"""
+Streaming exports of applications as CSV or newline-delimited JSON.
+
+Rows are read with ``QuerySet.iterator(chunk_size=...)`` (a server-side
+cursor on PostgreSQL) and encoded one at a time, so memory use does not
+depend on how many rows are exported.
+
+``aexport_applications`` is the same export as an async iterator, for
+ASGI. Django's ASGI handler can only stream an async iterator: given a sync
+one it reads the whole thing in a thread before sending the first byte.
+Here rows are fetched a chunk at a time in a thread and encoded on the
+event loop as they arrive.
+"""
+import csv
+import datetime
+import itertools
+import json
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+
+EXPORT_FIELDS = [
+    'id', 'company_name', 'role', 'location', 'status', 'applied_date',
+    'interview_date', 'notes', 'created_at', 'updated_at',
+]
+
+CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class _Echo:
+    """File-like object whose write() hands the value back to csv.writer"""
+
+    def write(self, value):
+        return value
+
+
+def _to_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _to_json(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def iter_rows(queryset, columns, chunk_size=None):
+    """Yield tuples for ``columns`` (ORM lookups) through a server-side cursor"""
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    return queryset.values_list(*columns).iterator(chunk_size=chunk_size)
+
+
+async def aiter_rows(queryset, columns, chunk_size=None):
+    """
+    Async version of ``iter_rows``: each chunk is fetched in a thread.
+
+    ``QuerySet.aiterator()`` would do, except that for ``values_list()`` it
+    runs the query on the event loop and fails.
+    """
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    rows = iter_rows(queryset, columns, chunk_size)
+    fetch = sync_to_async(lambda: list(itertools.islice(rows, chunk_size)))
+    while chunk := await fetch():
+        for row in chunk:
+            yield row
+
+
+def stream_csv(rows, header):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow([_to_text(value) for value in row])
+
+
+def stream_ndjson(rows, header):
+    for row in rows:
+        record = {name: _to_json(value) for name, value in zip(header, row)}
+        yield json.dumps(record, separators=(',', ':')) + '\n'
+
+
+async def astream_csv(rows, header):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(header)
+    async for row in rows:
+        yield writer.writerow([_to_text(value) for value in row])
+
+
+async def astream_ndjson(rows, header):
+    async for row in rows:
+        record = {name: _to_json(value) for name, value in zip(header, row)}
+        yield json.dumps(record, separators=(',', ':')) + '\n'
+
+
+STREAMERS = {
+    'csv': stream_csv,
+    'ndjson': stream_ndjson,
+}
+
+ASYNC_STREAMERS = {
+    'csv': astream_csv,
+    'ndjson': astream_ndjson,
+}
+
+
+def _export_columns(include_user):
+    columns = list(EXPORT_FIELDS)
+    header = list(EXPORT_FIELDS)
+    if include_user:
+        columns.insert(1, 'user__email')
+        header.insert(1, 'user')
+    return columns, header
+
+
+def export_applications(queryset, export_format, include_user=False, chunk_size=None):
+    """
+    Return an iterator of encoded chunks for ``queryset`` in ``export_format``.
+
+    With ``include_user`` each row also carries the owner's email, for
+    exports spanning several users.
+    """
+    columns, header = _export_columns(include_user)
+    rows = iter_rows(queryset.order_by('created_at', 'id'), columns, chunk_size)
+    return STREAMERS[export_format](rows, header)
+
+
+def aexport_applications(queryset, export_format, include_user=False, chunk_size=None):
+    """Async version of ``export_applications``, for streaming under ASGI"""
+    columns, header = _export_columns(include_user)
+    rows = aiter_rows(queryset.order_by('created_at', 'id'), columns, chunk_size)
+    return ASYNC_STREAMERS[export_format](rows, header)
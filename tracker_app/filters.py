@@ -0,0 +1,124 @@
+import datetime
+from urllib.parse import urlencode
+
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from .models import Application
+from .serializers import APPLICATION_FIELDS
+
+
+STATUS_CODES = [code for code, _ in Application.STATUS_CHOICES]
+
+# Fields clients may sort by; each is backed by a (user, field) index
+ORDERING_FIELDS = ('applied_date', 'interview_date', 'company_name', 'updated_at', 'created_at')
+DEFAULT_ORDERING = ('-created_at', '-id')
+
+
+def parse_status_list(value):
+    """Parse a comma separated list of status codes"""
+    statuses = [item.strip().upper() for item in value.split(',') if item.strip()]
+    invalid = [item for item in statuses if item not in STATUS_CODES]
+    if invalid:
+        raise ValidationError({'status': [f'Unknown status: {", ".join(invalid)}']})
+    return statuses
+
+
+def parse_date_param(params, name):
+    value = params.get(name)
+    if not value:
+        return None
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if not isinstance(parsed, datetime.date):
+        raise ValidationError({name: ['Enter a date in YYYY-MM-DD format.']})
+    return parsed
+
+
+DATE_RANGE_FILTERS = (
+    ('applied_from', 'applied_date__gte'),
+    ('applied_to', 'applied_date__lte'),
+    ('interview_from', 'interview_date__gte'),
+    ('interview_to', 'interview_date__lte'),
+)
+
+FILTER_PARAMS = ('status', 'location') + tuple(name for name, _ in DATE_RANGE_FILTERS)
+
+
+def filter_applications(queryset, params):
+    """
+    Narrow an Application queryset using request-style query parameters.
+
+    Supported parameters: ``status`` (comma separated), ``location`` (exact),
+    ``applied_from``/``applied_to`` and ``interview_from``/``interview_to``
+    (inclusive ISO dates).
+    """
+    if params.get('status'):
+        queryset = queryset.filter(status__in=parse_status_list(params['status']))
+
+    if params.get('location'):
+        queryset = queryset.filter(location=params['location'].strip())
+
+    for name, lookup in DATE_RANGE_FILTERS:
+        value = parse_date_param(params, name)
+        if value:
+            queryset = queryset.filter(**{lookup: value})
+
+    return queryset
+
+
+def has_filters(params):
+    return any(params.get(name) for name in FILTER_PARAMS)
+
+
+def counted_statuses(params):
+    """
+    Return the statuses whose counters add up to the filtered total, or None
+    when other filters are present and the rows have to be counted
+    """
+    if not has_filters(params):
+        return STATUS_CODES
+    if any(params.get(name) for name in FILTER_PARAMS if name != 'status'):
+        return None
+    return parse_status_list(params['status'])
+
+
+def filters_key(params):
+    """Canonical form of the filter parameters, for cache keys"""
+    return urlencode(sorted((name, params[name]) for name in FILTER_PARAMS if params.get(name)))
+
+
+def parse_ordering(params):
+    """
+    Return the ordering requested with ``?ordering=[-]field``, with the
+    primary key appended as a tie-breaker so the order is total.
+    """
+    value = (params.get('ordering') or '').strip()
+    if not value:
+        return DEFAULT_ORDERING
+
+    descending = value.startswith('-')
+    field = value.lstrip('-')
+    if field not in ORDERING_FIELDS:
+        raise ValidationError({'ordering': [f'Must be one of: {", ".join(ORDERING_FIELDS)} (prefix - for descending)']})
+
+    prefix = '-' if descending else ''
+    return (f'{prefix}{field}', f'{prefix}id')
+
+
+def parse_fields(params):
+    """
+    Return the fields requested with ``?fields=a,b`` in output order, or None
+    for every field. Only serialized application fields may be named.
+    """
+    requested = {item.strip() for item in (params.get('fields') or '').split(',') if item.strip()}
+    if not requested:
+        return None
+    invalid = sorted(requested.difference(APPLICATION_FIELDS))
+    if invalid:
+        raise ValidationError({'fields': [
+            f'Unknown field: {", ".join(invalid)}. Must be among: {", ".join(APPLICATION_FIELDS)}'
+        ]})
+    return tuple(name for name in APPLICATION_FIELDS if name in requested)
@@ -1,6 +1,7 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.contrib.auth import authenticate
+from .availability import email_taken, username_taken
 from .models import Application, CustomUser
 
 
@@ -108,9 +109,9 @@ class CustomUserCreationForm(UserCreationForm):
         if not username:
             return username
             
-        # Check if username already exists
-        if CustomUser.objects.filter(username__iexact=username).exists():
-            existing_user = CustomUser.objects.get(username__iexact=username)
+        # Check if username already exists (case-insensitive, indexed). Always
+        # queried: the availability Bloom filter can miss other workers' users
+        if username_taken(username, use_filter=False):
             raise forms.ValidationError(
                 f"Username '{username}' is already taken. Please choose a different username or "
                 f"try logging in if this is your account."
@@ -122,9 +123,8 @@ class CustomUserCreationForm(UserCreationForm):
         if not email:
             return email
             
-        # Check if email already exists
-        if CustomUser.objects.filter(email__iexact=email).exists():
-            existing_user = CustomUser.objects.get(email__iexact=email)
+        # Check if email already exists (case-insensitive, indexed, always queried)
+        if email_taken(email, use_filter=False):
             raise forms.ValidationError(
                 f"An account with email '{email}' already exists. "
                 f"Please use a different email or try logging in if this is your account."
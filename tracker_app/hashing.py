@@ -0,0 +1,101 @@
+"""
+Bounded admission for password hashing and verification.
+
+bcrypt is deliberately slow. Left unbounded, a burst of logins occupies every
+request thread of a worker. Here each process admits:
+
+* at most ``PASSWORD_HASHING_MAX_CONCURRENCY`` hashes running at once;
+* at most ``PASSWORD_HASHING_MAX_QUEUE`` more waiting for a slot.
+
+Past that, callers get ``PasswordHashingBusy`` straight away.
+``PasswordHashingBusyMiddleware`` turns that into a 503 with Retry-After.
+Hashes run in the calling request thread (bcrypt releases the GIL), so an
+admitted hash costs no thread handoff.
+
+The bounds are per process, so they only matter when a process serves
+several requests at once: a threaded WSGI worker (the Procfile runs gunicorn
+with ``-k gthread``) or ASGI. Keep concurrency plus queue below the worker's
+thread count, so threads stay free for requests that do not hash.
+
+Queue wait and hash time are recorded separately in ``tracker_app.metrics``.
+"""
+import threading
+import time
+
+import bcrypt
+from django.conf import settings
+
+from . import metrics
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when the password hashing queue is full"""
+
+
+_lock = threading.Lock()
+_limits = None
+
+
+def _get_limits():
+    """Return the ``(admitted, running)`` semaphores, created on first use"""
+    global _limits
+    with _lock:
+        if _limits is None:
+            workers = max(1, settings.PASSWORD_HASHING_MAX_CONCURRENCY)
+            _limits = (
+                threading.BoundedSemaphore(workers + max(0, settings.PASSWORD_HASHING_MAX_QUEUE)),
+                threading.BoundedSemaphore(workers),
+            )
+        return _limits
+
+
+def reset():
+    """Forget the semaphores so changed settings take effect (tests)"""
+    global _limits
+    with _lock:
+        _limits = None
+
+
+def run(func, *args):
+    """Run ``func(*args)`` once a hashing slot is free, or raise PasswordHashingBusy"""
+    admitted, running = _get_limits()
+    if not admitted.acquire(blocking=False):
+        metrics.incr('password_hashing.rejected')
+        raise PasswordHashingBusy('Too many password operations in progress')
+
+    try:
+        submitted = time.perf_counter()
+        with running:
+            started = time.perf_counter()
+            metrics.observe('password_hashing.queue_wait_ms', (started - submitted) * 1000)
+            try:
+                return func(*args)
+            finally:
+                metrics.observe('password_hashing.hash_ms', (time.perf_counter() - started) * 1000)
+    finally:
+        admitted.release()
+
+
+BCRYPT_PREFIXES = ('$2a$', '$2b$', '$2y$')
+
+
+def gensalt():
+    return bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+
+
+def hashpw(password, salt):
+    return run(bcrypt.hashpw, password, salt)
+
+
+def needs_rehash(encoded):
+    """True unless ``encoded`` is a bcrypt hash at the configured cost"""
+    if not encoded or encoded[:4] not in BCRYPT_PREFIXES:
+        return True
+    try:
+        return int(encoded[4:6]) != settings.BCRYPT_ROUNDS
+    except ValueError:
+        return True
+
+
+def checkpw(password, hashed):
+    return run(bcrypt.checkpw, password, hashed)
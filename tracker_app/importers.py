@@ -0,0 +1,165 @@
+"""
+Bulk import of applications from CSV, NDJSON or JSON files.
+
+Records are parsed as a stream and validated with ApplicationSerializer in
+batches. Each batch of valid rows is inserted with ``bulk_create`` inside its
+own transaction, so a bad row is reported without aborting the file and a
+failure only rolls back the batch being written.
+"""
+import codecs
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from .models import Application, CustomUser
+from .serializers import ApplicationSerializer
+
+
+FORMATS = ('csv', 'ndjson', 'json')
+
+# Columns that may be blank in a spreadsheet but are not text fields
+NULLABLE_COLUMNS = ('interview_date', 'status')
+
+
+class InvalidRecord:
+    """Placeholder yielded for a record that could not be parsed"""
+
+    def __init__(self, message):
+        self.message = message
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    failed: int = 0
+    errors: list = field(default_factory=list)
+
+    def add_error(self, row, errors, max_reported):
+        self.failed += 1
+        if len(self.errors) < max_reported:
+            self.errors.append({'row': row, 'errors': errors})
+
+    def as_dict(self):
+        return {'created': self.created, 'failed': self.failed, 'errors': self.errors}
+
+
+def detect_format(filename, default='csv'):
+    extension = filename.rsplit('.', 1)[-1].lower() if filename and '.' in filename else ''
+    if extension in ('jsonl', 'ndjson'):
+        return 'ndjson'
+    if extension in FORMATS:
+        return extension
+    return default
+
+
+def iter_records(fileobj, file_format):
+    """
+    Yield dict records from a binary file object.
+
+    CSV and NDJSON are read line by line. A JSON document must hold a list of
+    objects and is loaded whole, so large files should use one of the other
+    formats.
+    """
+    if file_format == 'csv':
+        text = io.TextIOWrapper(fileobj, encoding='utf-8-sig', newline='')
+        yield from csv.DictReader(text)
+    elif file_format == 'ndjson':
+        reader = codecs.getreader('utf-8-sig')(fileobj)
+        for line in reader:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield InvalidRecord(f'Invalid JSON: {e}')
+    elif file_format == 'json':
+        records = json.load(codecs.getreader('utf-8-sig')(fileobj))
+        if not isinstance(records, list):
+            raise ValueError('A JSON import must contain a list of objects')
+        yield from records
+    else:
+        raise ValueError(f'Unsupported import format: {file_format}')
+
+
+def _clean_record(record):
+    if not isinstance(record, dict):
+        return None
+    cleaned = {}
+    for key, value in record.items():
+        if key is None:
+            continue
+        key = key.strip()
+        if isinstance(value, str):
+            value = value.strip()
+            if value == '' and key in NULLABLE_COLUMNS:
+                continue
+        cleaned[key] = value
+    return cleaned
+
+
+def _resolve_owners(records, owner):
+    """Map the ``user`` email column to users with one query per batch"""
+    if owner is not None:
+        return {}
+    emails = {record.get('user') for _, record in records if isinstance(record, dict)}
+    emails.discard(None)
+    return {user.email: user for user in CustomUser.objects.filter(email__in=emails)}
+
+
+def import_applications(records, owner=None, batch_size=None, max_errors=None, dry_run=False):
+    """
+    Validate and insert ``records`` (an iterable of dicts).
+
+    Rows belong to ``owner``; without an owner every row needs a ``user``
+    column holding an existing account's email. Returns an ImportResult with
+    1-based row numbers for rejected records.
+    """
+    batch_size = batch_size or settings.APPLICATIONS_IMPORT_BATCH_SIZE
+    max_errors = settings.APPLICATIONS_IMPORT_MAX_ERRORS if max_errors is None else max_errors
+    result = ImportResult()
+    validator = ApplicationSerializer()
+
+    numbered = enumerate(records, start=1)
+    while True:
+        batch = list(islice(numbered, batch_size))
+        if not batch:
+            break
+
+        owners = _resolve_owners(batch, owner)
+        valid = []
+        for row, record in batch:
+            if isinstance(record, InvalidRecord):
+                result.add_error(row, {'non_field_errors': [record.message]}, max_errors)
+                continue
+            data = _clean_record(record)
+            if data is None:
+                result.add_error(row, {'non_field_errors': ['Expected an object']}, max_errors)
+                continue
+
+            user = owner
+            if user is None:
+                user = owners.get(data.get('user'))
+                if user is None:
+                    result.add_error(row, {'user': ['Unknown or missing user email']}, max_errors)
+                    continue
+
+            try:
+                validated = validator.run_validation(data)
+            except ValidationError as e:
+                result.add_error(row, e.detail, max_errors)
+                continue
+            valid.append(Application(user=user, **validated))
+
+        if valid and not dry_run:
+            with transaction.atomic():
+                Application.objects.bulk_create(valid, batch_size=batch_size)
+        result.created += len(valid)
+
+    return result
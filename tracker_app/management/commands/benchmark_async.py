@@ -0,0 +1,241 @@
+import argparse
+import asyncio
+import datetime
+import io
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.backends.signals import connection_created
+
+from tracker_app.models import Application, CustomUser
+from tracker_app.serializers import CustomTokenObtainPairSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare one process serving an API endpoint under WSGI (sync views) and '
+        'under ASGI (async views) against a database with simulated latency'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/api/applications/', help='Endpoint to request (default: /api/applications/)')
+        parser.add_argument('--requests', type=int, default=200, help='Timed requests per run (default: 200)')
+        parser.add_argument(
+            '--threads',
+            type=int,
+            default=int(os.environ.get('GUNICORN_THREADS', 8)),
+            help='WSGI worker threads; the default matches the Procfile gthread worker, 1 a sync worker (default: GUNICORN_THREADS or 8)',
+        )
+        parser.add_argument('--concurrency', type=int, default=50, help='Requests in flight under ASGI (default: 50)')
+        parser.add_argument(
+            '--latency-ms',
+            type=float,
+            default=20.0,
+            help='Delay added to every SQL statement to emulate a remote database; 0 disables it (default: 20)',
+        )
+        parser.add_argument('--applications', type=int, default=50, help='Applications owned by the benchmark user (default: 50)')
+        # Internal: run one server mode in this process and print the result as JSON
+        parser.add_argument('--worker', choices=('wsgi', 'asgi'), help=argparse.SUPPRESS)
+        parser.add_argument('--token', help=argparse.SUPPRESS)
+
+    def handle(self, *args, **options):
+        if options['worker']:
+            result = self.run_worker(options)
+            self.stdout.write(json.dumps(result))
+            return
+
+        user = CustomUser.objects.create_user(
+            username=f'benchmark-{uuid.uuid4().hex[:8]}',
+            email=f'benchmark-{uuid.uuid4().hex[:8]}@example.com',
+            password=uuid.uuid4().hex,
+        )
+        try:
+            for index in range(options['applications']):
+                Application.objects.create(
+                    user=user, company_name=f'Company {index}', role='Engineer', applied_date=datetime.date.today()
+                )
+            token = str(CustomTokenObtainPairSerializer.get_token(user).access_token)
+            results = [self.spawn(mode, token, options) for mode in ('wsgi', 'asgi')]
+        finally:
+            user.delete()
+
+        self.stdout.write(
+            f'{options["path"]}, {options["requests"]} requests, {options["latency_ms"]:.0f} ms added per query'
+        )
+        self.stdout.write(f'{"mode":6} {"in flight":>9} {"req/s":>8} {"p50 ms":>8} {"p95 ms":>8} {"max RSS MB":>11} {"errors":>7}')
+        for result in results:
+            self.stdout.write(
+                f'{result["mode"]:6} {result["concurrency"]:9d} {result["rps"]:8.1f} {result["p50_ms"]:8.1f} '
+                f'{result["p95_ms"]:8.1f} {result["max_rss_mb"]:11.1f} {result["errors"]:7d}'
+            )
+        wsgi, asgi = results
+        self.stdout.write(self.style.SUCCESS(
+            f'ASGI served {asgi["rps"] / wsgi["rps"]:.1f}x the requests per second of WSGI '
+            f'using {asgi["max_rss_mb"] - wsgi["max_rss_mb"]:+.1f} MB'
+        ))
+
+    def spawn(self, mode, token, options):
+        command = [
+            sys.executable, os.path.join(settings.BASE_DIR, 'manage.py'), 'benchmark_async',
+            '--worker', mode, '--token', token,
+            '--path', options['path'],
+            '--requests', str(options['requests']),
+            '--threads', str(options['threads']),
+            '--concurrency', str(options['concurrency']),
+            '--latency-ms', str(options['latency_ms']),
+        ]
+        env = {**os.environ, 'API_ASYNC_VIEWS': 'True' if mode == 'asgi' else 'False'}
+        completed = subprocess.run(command, env=env, capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise CommandError(f'{mode} run failed:\n{completed.stderr}')
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+
+    # Worker process
+
+    def run_worker(self, options):
+        latency = options['latency_ms'] / 1000
+        if latency > 0:
+            def delay(execute, sql, params, many, context):
+                time.sleep(latency)
+                return execute(sql, params, many, context)
+
+            def add_latency(sender, connection, **kwargs):
+                # Fired on every reconnect of the same per-thread connection object
+                if delay not in connection.execute_wrappers:
+                    connection.execute_wrappers.append(delay)
+            connection_created.connect(add_latency, weak=False)
+
+        url = urlsplit(options['path'])
+        request = {'path': url.path, 'query': url.query, 'token': options['token']}
+        if options['worker'] == 'wsgi':
+            concurrency = max(1, options['threads'])
+            timings, errors, elapsed = self.run_wsgi(request, options['requests'], concurrency)
+        else:
+            concurrency = max(1, options['concurrency'])
+            timings, errors, elapsed = asyncio.run(self.run_asgi(request, options['requests'], concurrency))
+
+        timings.sort()
+        return {
+            'mode': options['worker'],
+            'concurrency': concurrency,
+            'errors': errors,
+            'rps': len(timings) / elapsed,
+            'p50_ms': statistics.median(timings) * 1000,
+            'p95_ms': timings[int(len(timings) * 0.95) - 1] * 1000,
+            'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        }
+
+    def run_wsgi(self, request, total, threads):
+        from placement_tracker_project.wsgi import application
+
+        def environ():
+            return {
+                'REQUEST_METHOD': 'GET',
+                'PATH_INFO': request['path'],
+                'QUERY_STRING': request['query'],
+                'SERVER_NAME': 'localhost',
+                'SERVER_PORT': '80',
+                'SERVER_PROTOCOL': 'HTTP/1.1',
+                'REMOTE_ADDR': '127.0.0.1',
+                'HTTP_HOST': 'localhost',
+                'HTTP_AUTHORIZATION': f'Bearer {request["token"]}',
+                'wsgi.version': (1, 0),
+                'wsgi.url_scheme': 'http',
+                'wsgi.input': io.BytesIO(),
+                'wsgi.errors': sys.stderr,
+                'wsgi.multithread': threads > 1,
+                'wsgi.multiprocess': True,
+                'wsgi.run_once': False,
+            }
+
+        errors = 0
+        lock = threading.Lock()
+
+        def one(_):
+            nonlocal errors
+            statuses = []
+            started = time.perf_counter()
+            body = application(environ(), lambda status, headers, exc_info=None: statuses.append(status))
+            for _ in body:
+                pass
+            body.close()
+            if not statuses[0].startswith('200'):
+                with lock:
+                    errors += 1
+            return time.perf_counter() - started
+
+        for _ in range(5):
+            one(None)
+        errors = 0
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            timings = list(executor.map(one, range(total)))
+        return timings, errors, time.perf_counter() - started
+
+    async def run_asgi(self, request, total, concurrency):
+        from placement_tracker_project.asgi import application
+
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'GET',
+            'scheme': 'http',
+            'path': request['path'],
+            'raw_path': request['path'].encode(),
+            'query_string': request['query'].encode(),
+            'root_path': '',
+            'headers': [(b'host', b'localhost'), (b'authorization', f'Bearer {request["token"]}'.encode())],
+            'client': ('127.0.0.1', 50000),
+            'server': ('localhost', 80),
+        }
+        errors = 0
+
+        async def one():
+            nonlocal errors
+            body_sent = False
+            statuses = []
+
+            async def receive():
+                nonlocal body_sent
+                if not body_sent:
+                    body_sent = True
+                    return {'type': 'http.request', 'body': b'', 'more_body': False}
+                # No disconnect: wait until the handler cancels the listener
+                await asyncio.Event().wait()
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    statuses.append(message['status'])
+
+            started = time.perf_counter()
+            await application(dict(scope), receive, send)
+            if statuses[0] != 200:
+                errors += 1
+            return time.perf_counter() - started
+
+        for _ in range(5):
+            await one()
+        errors = 0
+
+        remaining = iter(range(total))
+        timings = []
+
+        async def client():
+            for _ in remaining:
+                timings.append(await one())
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        return timings, errors, time.perf_counter() - started
@@ -0,0 +1,71 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from tracker_app import denylist
+from tracker_app.authentication import DenylistJWTAuthentication
+
+
+class Command(BaseCommand):
+    help = 'Measure the per-request cost of the access-token denylist check'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--entries',
+            type=int,
+            default=10000,
+            help='Number of revoked tokens to load into the denylist first (default: 10000)',
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=20000,
+            help='Timed calls per measurement (default: 20000)',
+        )
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+
+        revoked = []
+        for _ in range(options['entries']):
+            token = AccessToken()
+            token['user_id'] = 0
+            revoked.append(token)
+            denylist.revoke_access_token(token.payload)
+        denylist.revoke_user_tokens(0)
+
+        token = AccessToken()
+        token['user_id'] = 1
+        raw = str(token).encode()
+
+        try:
+            plain = self.time_per_call(JWTAuthentication().get_validated_token, raw, iterations)
+            checked = self.time_per_call(DenylistJWTAuthentication().get_validated_token, raw, iterations)
+            lookup = self.time_per_call(denylist.is_revoked, token.payload, iterations)
+            with override_settings(DENYLIST_LOCAL_TTL=0):
+                uncached = self.time_per_call(denylist.is_revoked, AccessToken().payload, iterations)
+            hit = self.time_per_call(denylist.is_revoked, revoked[-1].payload, iterations) if revoked else 0.0
+        finally:
+            jti_claim = settings.SIMPLE_JWT['JTI_CLAIM']
+            denylist.get_store().delete_many([f'denylist:jti:{entry[jti_claim]}' for entry in revoked] + ['denylist:user:0'])
+            denylist.clear()
+
+        self.stdout.write(f'Denylist entries:             {options["entries"]}')
+        self.stdout.write(f'JWT validation:               {plain:8.2f} us/request')
+        self.stdout.write(f'JWT validation + denylist:    {checked:8.2f} us/request')
+        self.stdout.write(f'Added per request:            {checked - plain:8.2f} us')
+        self.stdout.write(f'is_revoked (not revoked):     {lookup:8.2f} us')
+        self.stdout.write(f'is_revoked (store lookup):    {uncached:8.2f} us  (once per DENYLIST_LOCAL_TTL per token)')
+        self.stdout.write(f'is_revoked (revoked, local):  {hit:8.2f} us')
+
+    @staticmethod
+    def time_per_call(func, argument, iterations):
+        func(argument)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func(argument)
+        return (time.perf_counter() - start) / iterations * 1e6
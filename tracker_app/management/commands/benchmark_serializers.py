@@ -0,0 +1,88 @@
+import datetime
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from tracker_app.models import Application, CustomUser
+from tracker_app.renderers import ORJSONRenderer
+from tracker_app.serializers import ApplicationRecordSerializer, ApplicationSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure the per-row cost of fetching, serializing and rendering applications '
+        'with ApplicationSerializer + JSONRenderer and with the records fast path'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', type=int, nargs='+', default=[1000, 10000], help='Row counts to measure (default: 1000 10000)'
+        )
+        parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement; the fastest is kept (default: 3)')
+
+    def handle(self, *args, **options):
+        user = CustomUser.objects.create_user(
+            username=f'benchmark-{uuid.uuid4().hex[:8]}',
+            email=f'benchmark-{uuid.uuid4().hex[:8]}@example.com',
+            password=uuid.uuid4().hex,
+        )
+        try:
+            today = datetime.date.today()
+            Application.objects.bulk_create(
+                [
+                    Application(
+                        user=user,
+                        company_name=f'Company {index}',
+                        role='Software Engineer',
+                        location='Remote',
+                        applied_date=today - datetime.timedelta(days=index % 365),
+                        interview_date=today if index % 3 == 0 else None,
+                        notes='Referred by a former colleague',
+                    )
+                    for index in range(max(options['rows']))
+                ],
+                batch_size=1000,
+            )
+            applications = Application.objects.filter(user=user).order_by('-created_at', '-id')
+            paths = {
+                'serializer': lambda rows: self.measure(
+                    lambda: list(applications.select_related('user')[:rows]),
+                    lambda instances: ApplicationSerializer(instances, many=True).data,
+                    JSONRenderer(),
+                ),
+                'records': lambda rows: self.measure(
+                    lambda: list(ApplicationRecordSerializer.rows(applications[:rows])),
+                    lambda records: ApplicationRecordSerializer(records, many=True).data,
+                    ORJSONRenderer(),
+                ),
+            }
+
+            self.stdout.write(
+                f'{"rows":>6} {"path":10} {"fetch us":>9} {"serialize us":>13} {"render us":>10} {"total us":>9}  (per row)'
+            )
+            for rows in options['rows']:
+                totals = {}
+                for name, path in paths.items():
+                    timings = min((path(rows) for _ in range(max(1, options['repeat']))), key=sum)
+                    totals[name] = sum(timings)
+                    fetch, serialize, render = (seconds / rows * 1e6 for seconds in timings)
+                    self.stdout.write(
+                        f'{rows:6d} {name:10} {fetch:9.2f} {serialize:13.2f} {render:10.2f} {fetch + serialize + render:9.2f}'
+                    )
+                self.stdout.write(self.style.SUCCESS(
+                    f'{rows} rows: records path is {totals["serializer"] / totals["records"]:.1f}x faster'
+                ))
+        finally:
+            user.delete()
+
+    def measure(self, fetch, serialize, renderer):
+        started = time.perf_counter()
+        rows = fetch()
+        fetched = time.perf_counter()
+        data = serialize(rows)
+        serialized = time.perf_counter()
+        renderer.render(data)
+        rendered = time.perf_counter()
+        return fetched - started, serialized - fetched, rendered - serialized
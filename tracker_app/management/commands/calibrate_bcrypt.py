@@ -0,0 +1,64 @@
+import statistics
+import time
+
+import bcrypt
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = 'Measure bcrypt on this host and recommend BCRYPT_ROUNDS for a target hash latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target-ms',
+            type=float,
+            default=250.0,
+            help='Latency budget for one password hash in milliseconds (default: 250)',
+        )
+        parser.add_argument(
+            '--samples',
+            type=int,
+            default=3,
+            help='Hashes timed per work factor; the median is used (default: 3)',
+        )
+        parser.add_argument('--min-rounds', type=int, default=10, help='Lowest work factor to consider (default: 10)')
+        parser.add_argument('--max-rounds', type=int, default=16, help='Highest work factor to consider (default: 16)')
+
+    def handle(self, *args, **options):
+        target = options['target_ms']
+        samples = max(1, options['samples'])
+        min_rounds, max_rounds = options['min_rounds'], options['max_rounds']
+        if not 4 <= min_rounds <= max_rounds <= 31:
+            raise CommandError('Work factors must satisfy 4 <= --min-rounds <= --max-rounds <= 31')
+
+        password = b'calibration-password'
+        chosen = None
+        for rounds in range(min_rounds, max_rounds + 1):
+            salt = bcrypt.gensalt(rounds=rounds)
+            timings = []
+            for _ in range(samples):
+                start = time.perf_counter()
+                bcrypt.hashpw(password, salt)
+                timings.append((time.perf_counter() - start) * 1000)
+            median = statistics.median(timings)
+            self.stdout.write(f'rounds={rounds:2d}  {median:9.1f} ms')
+
+            if median > target:
+                break
+            chosen = rounds
+            # Each extra round doubles the cost; stop before a hash that would clearly overshoot
+            if median * 2 > target * 1.5:
+                break
+
+        if chosen is None:
+            raise CommandError(
+                f'Even {min_rounds} rounds exceed {target:.0f} ms on this host; '
+                'raise --target-ms or lower --min-rounds'
+            )
+
+        self.stdout.write(f'Current BCRYPT_ROUNDS: {settings.BCRYPT_ROUNDS}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Recommended BCRYPT_ROUNDS={chosen} (target {target:.0f} ms per hash). '
+            'Existing passwords are rehashed at the new cost on their next successful login.'
+        ))
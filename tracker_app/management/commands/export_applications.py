@@ -0,0 +1,81 @@
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from tracker_app.exporters import STREAMERS, export_applications
+from tracker_app.filters import filter_applications
+from tracker_app.models import Application
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Stream applications (all users by default) to a CSV or NDJSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--format',
+            choices=sorted(STREAMERS),
+            default='csv',
+            dest='export_format',
+            help='Output format (default: csv)',
+        )
+        parser.add_argument(
+            '--output', '-o',
+            help='File to write to (default: stdout)',
+        )
+        parser.add_argument(
+            '--user',
+            action='append',
+            dest='users',
+            help='Only export applications of this email (repeatable)',
+        )
+        parser.add_argument('--status', help='Comma separated status codes to include')
+        parser.add_argument('--applied-from', help='Earliest applied_date (YYYY-MM-DD)')
+        parser.add_argument('--applied-to', help='Latest applied_date (YYYY-MM-DD)')
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help='Rows fetched per database round trip (default: EXPORT_CHUNK_SIZE)',
+        )
+
+    def handle(self, *args, **options):
+        queryset = Application.objects.all()
+        if options['users']:
+            queryset = queryset.filter(user__email__in=options['users'])
+
+        params = {
+            'status': options['status'],
+            'applied_from': options['applied_from'],
+            'applied_to': options['applied_to'],
+        }
+        try:
+            queryset = filter_applications(queryset, params)
+        except ValidationError as e:
+            raise CommandError(e.detail)
+
+        chunks = export_applications(
+            queryset,
+            options['export_format'],
+            include_user=True,
+            chunk_size=options['chunk_size'],
+        )
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+                written = self.write_chunks(chunks, output)
+            if options['export_format'] == 'csv':
+                written -= 1  # header line
+            self.stderr.write(self.style.SUCCESS(f'Exported {written} rows to {options["output"]}'))
+        else:
+            self.write_chunks(chunks, sys.stdout)
+
+    def write_chunks(self, chunks, output):
+        """Write every chunk (one line each) and return the number written"""
+        written = 0
+        for chunk in chunks:
+            output.write(chunk)
+            written += 1
+        return written
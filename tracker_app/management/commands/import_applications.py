@@ -0,0 +1,68 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from tracker_app.importers import FORMATS, detect_format, import_applications, iter_records
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Import applications from a CSV, NDJSON or JSON file'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to import')
+        parser.add_argument(
+            '--user',
+            help='Email of the owner of every row; without it each row needs a "user" email column',
+        )
+        parser.add_argument(
+            '--format',
+            choices=FORMATS,
+            dest='file_format',
+            help='File format (default: detected from the extension)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help='Rows validated and inserted per transaction (default: APPLICATIONS_IMPORT_BATCH_SIZE)',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Validate every row without inserting anything',
+        )
+
+    def handle(self, *args, **options):
+        owner = None
+        if options['user']:
+            try:
+                owner = User.objects.get(email=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f'User {options["user"]} does not exist')
+
+        file_format = options['file_format'] or detect_format(options['path'])
+        started = time.perf_counter()
+        try:
+            with open(options['path'], 'rb') as source:
+                result = import_applications(
+                    iter_records(source, file_format),
+                    owner=owner,
+                    batch_size=options['batch_size'],
+                    max_errors=200,
+                    dry_run=options['dry_run'],
+                )
+        except (OSError, ValueError, UnicodeDecodeError) as e:
+            raise CommandError(f'Could not read {options["path"]}: {e}')
+        elapsed = time.perf_counter() - started
+
+        for error in result.errors:
+            self.stdout.write(self.style.WARNING(f'Row {error["row"]}: {error["errors"]}'))
+        if result.failed > len(result.errors):
+            self.stdout.write(self.style.WARNING(f'... {result.failed - len(result.errors)} more rejected rows'))
+
+        verb = 'Validated' if options['dry_run'] else 'Imported'
+        self.stdout.write(self.style.SUCCESS(
+            f'{verb} {result.created} rows, rejected {result.failed} ({elapsed:.1f}s)'
+        ))
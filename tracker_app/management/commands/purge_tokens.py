@@ -0,0 +1,62 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tracker_app.token_reaper import purge_revocations, purge_tokens, purgeable_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete expired refresh tokens, revoked ones past the retention window and expired '
+        'access token revocations, in batches'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Rows deleted per transaction (default: REFRESH_TOKEN_PURGE_BATCH_SIZE)',
+        )
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=None,
+            help='Days to keep revoked tokens (default: REFRESH_TOKEN_REVOKED_RETENTION_DAYS)',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0.0,
+            help='Seconds to sleep between batches to spread out the load (default: 0)',
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Keep running and purge every N seconds instead of once',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only report how many rows would be deleted',
+        )
+
+    def handle(self, *args, **options):
+        if options['dry_run']:
+            count = purgeable_tokens(retention_days=options['retention_days']).count()
+            self.stdout.write(f'{count} refresh token(s) would be deleted')
+            return
+
+        while True:
+            deleted = purge_tokens(
+                batch_size=options['batch_size'],
+                retention_days=options['retention_days'],
+                pause=options['pause'],
+            )
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} refresh token(s)'))
+            revocations = purge_revocations(batch_size=options['batch_size'], pause=options['pause'])
+            self.stdout.write(self.style.SUCCESS(f'Deleted {revocations} expired access token revocation(s)'))
+            if options['interval'] <= 0:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+
+from tracker_app.counters import rebuild_status_counters, verify_status_counters
+from tracker_app.dashboard import bump_dashboard_version
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Rebuild or verify the per-user application status counters from the Application table'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Only report counters that disagree with the source table (exit code 1 on drift)',
+        )
+        parser.add_argument(
+            '--user',
+            action='append',
+            dest='users',
+            help='Email of a user to limit the rebuild/verification to (repeatable)',
+        )
+
+    def handle(self, *args, **options):
+        user_ids = None
+        if options['users']:
+            user_ids = list(User.objects.filter(email__in=options['users']).values_list('pk', flat=True))
+            if len(user_ids) != len(set(options['users'])):
+                raise CommandError('One or more users were not found')
+
+        if options['verify']:
+            mismatches = verify_status_counters(user_ids)
+            for user_id, status, stored, actual in mismatches:
+                self.stdout.write(
+                    self.style.WARNING(f'user {user_id} {status}: stored {stored}, actual {actual}')
+                )
+            if mismatches:
+                raise CommandError(f'{len(mismatches)} counter(s) out of sync')
+            self.stdout.write(self.style.SUCCESS('All status counters match the Application table'))
+            return
+
+        written = rebuild_status_counters(user_ids)
+        # Cached dashboards still hold the old counts; the rebuild has
+        # committed, so drop them like the write paths do on commit
+        if user_ids is None:
+            user_ids = User.objects.values_list('pk', flat=True).iterator()
+        for user_id in user_ids:
+            bump_dashboard_version(user_id)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} status counter(s)'))
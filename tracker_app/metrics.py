@@ -0,0 +1,57 @@
+"""
+Lightweight in-process metrics registry.
+
+Counters and timing summaries are kept per worker process and exposed through
+the staff-only ``/api/metrics/`` endpoint.
+"""
+import threading
+from collections import defaultdict
+
+
+_lock = threading.Lock()
+_counters = defaultdict(int)
+_timings = {}
+
+
+def incr(name, value=1):
+    """Increment a named counter"""
+    with _lock:
+        _counters[name] += value
+
+
+def observe(name, value):
+    """Record a single observation (e.g. a duration in milliseconds)"""
+    with _lock:
+        summary = _timings.get(name)
+        if summary is None:
+            _timings[name] = {'count': 1, 'total': value, 'max': value}
+        else:
+            summary['count'] += 1
+            summary['total'] += value
+            if value > summary['max']:
+                summary['max'] = value
+
+
+def get_counter(name):
+    with _lock:
+        return _counters.get(name, 0)
+
+
+def snapshot():
+    """Return a copy of every counter and timing summary"""
+    with _lock:
+        timings = {}
+        for name, summary in _timings.items():
+            timings[name] = {
+                'count': summary['count'],
+                'total': round(summary['total'], 3),
+                'avg': round(summary['total'] / summary['count'], 3),
+                'max': round(summary['max'], 3),
+            }
+        return {'counters': dict(_counters), 'timings': timings}
+
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _timings.clear()
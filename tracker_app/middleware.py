@@ -0,0 +1,95 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from .compression import compress_response, is_compressible, negotiate
+from .hashing import PasswordHashingBusy
+
+
+class PasswordHashingBusyMiddleware(MiddlewareMixin):
+    """Answer 503 with Retry-After when the password hashing queue is full"""
+
+    retry_after = 1
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, PasswordHashingBusy):
+            return None
+        message = 'The server is busy. Please try again shortly.'
+        if request.path.startswith('/api/'):
+            response = JsonResponse({'error': message}, status=503)
+        else:
+            response = HttpResponse(message, status=503, content_type='text/plain')
+        response['Retry-After'] = str(self.retry_after)
+        return response
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise that also runs natively under ASGI
+
+    WhiteNoise's middleware is sync-only, which makes Django run every ASGI
+    request through a thread at that point of the stack. Here non-static
+    requests pass straight through to the async handler, and only serving a
+    file (opening it and stat-ing it) happens in a thread.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, **kwargs):
+        super().__init__(get_response, **kwargs)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = await sync_to_async(self.find_file, thread_sensitive=False)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return await sync_to_async(self.serve, thread_sensitive=False)(static_file, request)
+        return await self.get_response(request)
+
+
+class CompressionMiddleware:
+    """
+    Compress JSON API responses with Brotli or gzip (see ``compression``)
+
+    Runs natively under WSGI and ASGI; under ASGI the compression itself
+    happens in a thread so the event loop keeps serving other requests.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        coding = self.select_coding(request, response)
+        if coding is not None:
+            compress_response(response, coding)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        coding = self.select_coding(request, response)
+        if coding is not None:
+            await sync_to_async(compress_response, thread_sensitive=False)(response, coding)
+        return response
+
+    def select_coding(self, request, response):
+        if not is_compressible(response):
+            return None
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return negotiate(request.META.get('HTTP_ACCEPT_ENCODING'))
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_status_counters(apps, schema_editor):
+    Application = apps.get_model('tracker_app', 'Application')
+    ApplicationStatusCounter = apps.get_model('tracker_app', 'ApplicationStatusCounter')
+    rows = Application.objects.order_by().values('user_id', 'status').annotate(total=Count('pk'))
+    ApplicationStatusCounter.objects.bulk_create(
+        [
+            ApplicationStatusCounter(user_id=row['user_id'], status=row['status'], count=row['total'])
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStatusCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('WISHLIST', 'Wishlist'), ('APPLIED', 'Applied'), ('OA', 'Online Assessment'), ('INTERVIEW', 'Interview'), ('OFFER', 'Offer'), ('REJECTED', 'Rejected')], max_length=20)),
+                ('count', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'status'), name='unique_status_counter_per_user')],
+            },
+        ),
+        migrations.RunPython(populate_status_counters, migrations.RunPython.noop),
+    ]
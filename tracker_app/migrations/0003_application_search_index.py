@@ -0,0 +1,126 @@
+from django.db import migrations
+
+
+# PostgreSQL: a generated, weighted tsvector column with a GIN index
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE tracker_app_application ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english'::regconfig, coalesce(company_name, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(role, '')), 'A') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(location, '')), 'B') ||
+        setweight(to_tsvector('english'::regconfig, coalesce(notes, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX tracker_app_application_search_gin ON tracker_app_application USING GIN (search_vector)",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS tracker_app_application_search_gin",
+    "ALTER TABLE tracker_app_application DROP COLUMN IF EXISTS search_vector",
+]
+
+# SQLite: an FTS5 shadow table kept in sync by triggers. Application ids are
+# UUIDs, so a small map table assigns each one a stable integer rowid. The
+# owner column holds a per-user token so searches are restricted to one user
+# inside the full-text index itself.
+SQLITE_FORWARD = [
+    """
+    CREATE TABLE tracker_app_application_fts_map (
+        rowid INTEGER PRIMARY KEY,
+        application_id char(32) NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE tracker_app_application_fts USING fts5(
+        company_name, role, location, notes, owner,
+        tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER tracker_app_application_fts_insert
+    AFTER INSERT ON tracker_app_application BEGIN
+        INSERT INTO tracker_app_application_fts_map (application_id) VALUES (new.id);
+        INSERT INTO tracker_app_application_fts (rowid, company_name, role, location, notes, owner)
+        VALUES (last_insert_rowid(), new.company_name, new.role, new.location, new.notes, 'u' || new.user_id);
+    END
+    """,
+    """
+    CREATE TRIGGER tracker_app_application_fts_update
+    AFTER UPDATE OF company_name, role, location, notes, user_id ON tracker_app_application BEGIN
+        UPDATE tracker_app_application_fts
+        SET company_name = new.company_name, role = new.role, location = new.location,
+            notes = new.notes, owner = 'u' || new.user_id
+        WHERE rowid = (SELECT rowid FROM tracker_app_application_fts_map WHERE application_id = new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER tracker_app_application_fts_delete
+    AFTER DELETE ON tracker_app_application BEGIN
+        DELETE FROM tracker_app_application_fts
+        WHERE rowid = (SELECT rowid FROM tracker_app_application_fts_map WHERE application_id = old.id);
+        DELETE FROM tracker_app_application_fts_map WHERE application_id = old.id;
+    END
+    """,
+    "INSERT INTO tracker_app_application_fts_map (application_id) SELECT id FROM tracker_app_application",
+    """
+    INSERT INTO tracker_app_application_fts (rowid, company_name, role, location, notes, owner)
+    SELECT m.rowid, a.company_name, a.role, a.location, a.notes, 'u' || a.user_id
+    FROM tracker_app_application a
+    JOIN tracker_app_application_fts_map m ON m.application_id = a.id
+    """,
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS tracker_app_application_fts_insert",
+    "DROP TRIGGER IF EXISTS tracker_app_application_fts_update",
+    "DROP TRIGGER IF EXISTS tracker_app_application_fts_delete",
+    "DROP TABLE IF EXISTS tracker_app_application_fts",
+    "DROP TABLE IF EXISTS tracker_app_application_fts_map",
+]
+
+
+def sqlite_has_fts5(schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        if cursor.fetchone()[0]:
+            return True
+        try:
+            cursor.execute("CREATE VIRTUAL TABLE temp.tracker_fts5_probe USING fts5(x)")
+            cursor.execute("DROP TABLE temp.tracker_fts5_probe")
+            return True
+        except Exception:
+            return False
+
+
+def run_statements(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        run_statements(schema_editor, POSTGRES_FORWARD)
+    elif vendor == 'sqlite' and sqlite_has_fts5(schema_editor):
+        run_statements(schema_editor, SQLITE_FORWARD)
+    # Other backends fall back to unindexed icontains search
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        run_statements(schema_editor, POSTGRES_BACKWARD)
+    elif vendor == 'sqlite':
+        run_statements(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker_app', '0002_application_status_counter'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
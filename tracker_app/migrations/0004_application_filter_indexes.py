@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker_app', '0003_application_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'created_at'], name='tracker_app_user_id_8970bd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'updated_at'], name='tracker_app_user_id_b62aaa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'applied_date'], name='tracker_app_user_id_ebbf89_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'interview_date'], name='tracker_app_user_id_52758d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'company_name'], name='tracker_app_user_id_46d0a7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', 'location'], name='tracker_app_user_id_ce4000_idx'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+import hashlib
+
+from django.db import migrations, models
+
+
+def populate_token_digests(apps, schema_editor):
+    RefreshToken = apps.get_model('tracker_app', 'RefreshToken')
+    pending = RefreshToken.objects.filter(token_digest__isnull=True).only('pk', 'token')
+    batch = []
+    for stored in pending.iterator(chunk_size=1000):
+        stored.token_digest = hashlib.sha256(stored.token.encode('utf-8')).hexdigest()
+        batch.append(stored)
+        if len(batch) >= 1000:
+            RefreshToken.objects.bulk_update(batch, ['token_digest'])
+            batch = []
+    if batch:
+        RefreshToken.objects.bulk_update(batch, ['token_digest'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker_app', '0004_application_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='refreshtoken',
+            name='token_digest',
+            field=models.CharField(editable=False, max_length=64, null=True),
+        ),
+        migrations.RunPython(populate_token_digests, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='refreshtoken',
+            name='token_digest',
+            field=models.CharField(editable=False, max_length=64, unique=True),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:36
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_case_variant_duplicates(apps, schema_editor):
+    """Name the users that differ only in case, which the constraints below would reject"""
+    CustomUser = apps.get_model('tracker_app', 'CustomUser')
+    problems = []
+    for field in ('username', 'email'):
+        users = CustomUser.objects.annotate(folded=Lower(field))
+        duplicates = (
+            users.order_by().values('folded').annotate(total=Count('pk')).filter(total__gt=1)
+            .values_list('folded', flat=True)
+        )
+        for folded in duplicates:
+            variants = users.filter(folded=folded).order_by('pk').values_list('pk', field)
+            problems.append(f'  {field} {folded!r}: ' + ', '.join(f'{value!r} (id {pk})' for pk, value in variants))
+    if problems:
+        raise RuntimeError(
+            'These users differ only in case; rename or merge them before adding the '
+            'case-insensitive unique constraints:\n' + '\n'.join(problems)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('tracker_app', '0006_refreshtoken_revoked_at_and_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_case_variant_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('username'), name='unique_username_case_insensitive', violation_error_message='A user with this username already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='customuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='unique_email_case_insensitive', violation_error_message='A user with this email already exists.'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:30
+
+import tracker_app.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tracker_app', '0008_accesstokenrevocation'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='customuser',
+            managers=[
+                ('objects', tracker_app.models.CustomUserManager()),
+            ],
+        ),
+    ]
@@ -1,10 +1,32 @@
+import hashlib
 import uuid
-import bcrypt
-from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.db import models, transaction
+from django.contrib.auth.models import AbstractUser, UserManager
+from django.db.models.functions import Lower
 from django.urls import reverse
 from django.utils import timezone
 
+from . import hashing
+
+
+# ``username__lower=...`` compiles to LOWER("username") = ..., which matches the
+# functional unique indexes below (unlike iexact, which cannot use an index)
+models.CharField.register_lookup(Lower)
+
+
+class CustomUserManager(UserManager):
+    """
+    UserManager whose create_user() and create_superuser() hash through
+    CustomUser.set_password, so new accounts get bcrypt at BCRYPT_ROUNDS on
+    the bounded hashing pool instead of Django's default hasher
+    """
+
+    def _create_user_object(self, username, email, password, **extra_fields):
+        user = super()._create_user_object(username, email, None, **extra_fields)
+        if password is not None:
+            user.set_password(password)
+        return user
+
 
 class CustomUser(AbstractUser):
     """
@@ -19,31 +41,140 @@ class CustomUser(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username']
 
+    objects = CustomUserManager()
+
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            models.UniqueConstraint(
+                Lower('username'),
+                name='unique_username_case_insensitive',
+                violation_error_message='A user with this username already exists.',
+            ),
+            models.UniqueConstraint(
+                Lower('email'),
+                name='unique_email_case_insensitive',
+                violation_error_message='A user with this email already exists.',
+            ),
+        ]
+
     def set_password(self, raw_password):
         """Override to use bcrypt for password hashing"""
         if raw_password is None:
             self.password = None
         else:
-            # Generate salt and hash password with bcrypt
-            salt = bcrypt.gensalt()
-            hashed = bcrypt.hashpw(raw_password.encode('utf-8'), salt)
+            # Hash with bcrypt at BCRYPT_ROUNDS on the bounded hashing pool
+            hashed = hashing.hashpw(raw_password.encode('utf-8'), hashing.gensalt())
             self.password = hashed.decode('utf-8')
 
     def check_password(self, raw_password):
-        """Override to check bcrypt password"""
+        """
+        Override to check bcrypt password
+
+        On success, hashes at another cost or from another algorithm (e.g.
+        PBKDF2 from migrate_users) are replaced with a bcrypt hash at
+        BCRYPT_ROUNDS.
+        """
         if not raw_password or not self.password:
             return False
         try:
-            return bcrypt.checkpw(raw_password.encode('utf-8'), self.password.encode('utf-8'))
+            valid = hashing.checkpw(raw_password.encode('utf-8'), self.password.encode('utf-8'))
         except ValueError:
             # Fallback to Django's default password checking for existing users
             from django.contrib.auth.hashers import check_password
-            return check_password(raw_password, self.password)
+            valid = hashing.run(check_password, raw_password, self.password)
+
+        if valid and self.pk is not None and hashing.needs_rehash(self.password):
+            self.set_password(raw_password)
+            self.save(update_fields=['password'])
+        return valid
 
     def __str__(self):
         return self.email
 
 
+class ApplicationQuerySet(models.QuerySet):
+    """
+    QuerySet that keeps ApplicationStatusCounter rows and dashboard caches in
+    step with bulk writes, which bypass Model.save() and post_save.
+    """
+
+    def update(self, **kwargs):
+        from .counters import (
+            application_writes, bulk_update_in_progress, mark_changed, record_status_change, schedule_rebuild
+        )
+
+        if bulk_update_in_progress():
+            return super().update(**kwargs)
+
+        # auto_now only applies to save(); keep updated_at (and the ETags
+        # derived from it) moving for queryset updates too
+        kwargs.setdefault('updated_at', timezone.now())
+
+        with transaction.atomic(using=self.db), application_writes():
+            rows = list(self.select_for_update(of=('self',)).values_list('user_id', 'status'))
+            updated = super().update(**kwargs)
+            new_status = kwargs.get('status')
+            for user_id, old_status in rows:
+                if 'status' not in kwargs:
+                    mark_changed(user_id)
+                elif isinstance(new_status, str):
+                    record_status_change(user_id, old_status, new_status)
+                else:
+                    # Expression updates: the new values are only known to the database
+                    schedule_rebuild(user_id)
+        return updated
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from .counters import application_writes, record_status_change, schedule_rebuild
+
+        objs = list(objs)
+        conflicts_possible = kwargs.get('ignore_conflicts') or kwargs.get('update_conflicts')
+        with transaction.atomic(using=self.db), application_writes():
+            created = super().bulk_create(objs, *args, **kwargs)
+            for obj in created:
+                if conflicts_possible:
+                    schedule_rebuild(obj.user_id)
+                else:
+                    record_status_change(obj.user_id, None, obj.status)
+                obj._loaded_status = obj.status
+        return created
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        from .counters import (
+            application_writes, mark_changed, record_status_change, schedule_rebuild, suppress_update_tracking
+        )
+
+        objs = list(objs)
+        with transaction.atomic(using=self.db), application_writes():
+            stored = {}
+            if 'status' in fields:
+                # Statuses as stored now, locked, rather than as they were read
+                stored = dict(
+                    self.model._base_manager.using(self.db).select_for_update(of=('self',))
+                    .filter(pk__in=[obj.pk for obj in objs]).values_list('pk', 'status')
+                )
+            with suppress_update_tracking():
+                updated = super().bulk_update(objs, fields, *args, **kwargs)
+            for obj in objs:
+                old_status = stored.get(obj.pk)
+                if 'status' not in fields:
+                    mark_changed(obj.user_id)
+                elif old_status is None:
+                    schedule_rebuild(obj.user_id)
+                else:
+                    record_status_change(obj.user_id, old_status, obj.status)
+                obj._loaded_status = obj.status
+        return updated
+
+    def delete(self):
+        from .counters import application_writes
+
+        # post_delete still fires per row; the batch folds those into one
+        # counter update per (user, status)
+        with transaction.atomic(using=self.db), application_writes():
+            return super().delete()
+
+
 class Application(models.Model):
     STATUS_CHOICES = [
         ('WISHLIST', 'Wishlist'),
@@ -65,17 +196,63 @@ class Application(models.Model):
     notes = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ApplicationQuerySet.as_manager()
     
     class Meta:
         indexes = [
             models.Index(fields=['user']),
             models.Index(fields=['status']),
             models.Index(fields=['user', 'status']),
+            # Filtering and ordering paths of the applications API
+            models.Index(fields=['user', 'created_at']),
+            models.Index(fields=['user', 'updated_at']),
+            models.Index(fields=['user', 'applied_date']),
+            models.Index(fields=['user', 'interview_date']),
+            models.Index(fields=['user', 'company_name']),
+            models.Index(fields=['user', 'location']),
         ]
         ordering = ['-created_at']
     
     def __str__(self):
         return f"{self.company_name} - {self.role} ({self.status})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so status counters can be adjusted on save
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
+    def _lock_stored_status(self, using):
+        """
+        Re-read the stored status under a row lock. ``_loaded_status`` dates
+        from when the row was read, so two concurrent edits would otherwise
+        both count the same old status down.
+        """
+        self._loaded_status = (
+            type(self)._base_manager.using(using).select_for_update(of=('self',))
+            .filter(pk=self.pk).values_list('status', flat=True).first()
+        )
+
+    def save(self, *args, **kwargs):
+        # Write the row and its status counter in the same transaction
+        using = kwargs.get('using')
+        update_fields = kwargs.get('update_fields')
+        with transaction.atomic(using=using):
+            if (
+                not self._state.adding
+                and 'status' in self.__dict__
+                and (update_fields is None or 'status' in update_fields)
+            ):
+                self._lock_stored_status(using)
+            super().save(*args, **kwargs)
+        self._loaded_status = self.status
+
+    def delete(self, using=None, keep_parents=False):
+        with transaction.atomic(using=using):
+            self._lock_stored_status(using)
+            return super().delete(using=using, keep_parents=keep_parents)
     
     def get_absolute_url(self):
         return reverse('application_detail', kwargs={'pk': self.pk})
@@ -92,27 +269,81 @@ class Application(models.Model):
         return True
 
 
+class ApplicationStatusCounter(models.Model):
+    """
+    Denormalized number of applications per user and status.
+
+    Maintained transactionally by Application writes (see tracker_app.counters)
+    and rebuilt with ``manage.py rebuild_status_counters``.
+    """
+    user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='status_counters')
+    status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'status'], name='unique_status_counter_per_user'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.status}: {self.count}"
+
+
 class RefreshToken(models.Model):
     """
     Model to store refresh tokens for JWT authentication
     """
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE, related_name='refresh_tokens')
     token = models.TextField()
+    # SHA-256 of ``token``; lookups go through this indexed column instead of
+    # comparing the full JWT text
+    token_digest = models.CharField(max_length=64, unique=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     expires_at = models.DateTimeField()
     is_revoked = models.BooleanField(default=False)
+    revoked_at = models.DateTimeField(null=True, blank=True)
     device_info = models.CharField(max_length=255, blank=True)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Active-session listing: user_id = ? AND is_revoked = false AND expires_at > now
+            models.Index(fields=['user', 'is_revoked', 'expires_at']),
+            # Batches selected by the token reaper
+            models.Index(fields=['is_revoked', 'expires_at']),
+        ]
+
+    @staticmethod
+    def digest(token):
+        return hashlib.sha256(str(token).encode('utf-8')).hexdigest()
+
+    def save(self, *args, **kwargs):
+        self.token_digest = self.digest(self.token)
+        super().save(*args, **kwargs)
 
     def is_expired(self):
         return timezone.now() > self.expires_at
 
     def revoke(self):
         self.is_revoked = True
+        self.revoked_at = timezone.now()
         self.save()
 
     def __str__(self):
         return f"RefreshToken for {self.user.email}"
+
+
+class AccessTokenRevocation(models.Model):
+    """
+    Revoked access token (``denylist:jti:<jti>``) or per-user cutoff
+    (``denylist:user:<id>``), shared by every worker when no Redis cache is
+    configured; see tracker_app.denylist. Rows are never evicted early: the
+    token reaper deletes them once ``expires_at`` has passed.
+    """
+    key = models.CharField(max_length=255, primary_key=True)
+    value = models.BigIntegerField()
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return self.key
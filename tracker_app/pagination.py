@@ -0,0 +1,254 @@
+import base64
+import binascii
+import json
+
+from django.core.paginator import InvalidPage, Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+TRUTHY = ('1', 'true', 'yes', 'on')
+
+
+class CountedPaginator(Paginator):
+    """
+    Django paginator whose total comes from a callable (e.g. the denormalized
+    status counters) instead of a COUNT(*) over the queryset.
+    """
+
+    def __init__(self, *args, count_func=None, **kwargs):
+        self.count_func = count_func
+        super().__init__(*args, **kwargs)
+
+    @cached_property
+    def count(self):
+        if self.count_func is None:
+            return super().count
+        return self.count_func()
+
+
+class CheapCountPageNumberPagination(PageNumberPagination):
+    """
+    Page number pagination that asks the view for the total count.
+
+    Views may define ``get_total_count(queryset)`` returning a precomputed
+    count; otherwise the usual COUNT(*) is issued.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        count_func = None
+        if view is not None and hasattr(view, 'get_total_count'):
+            count_func = lambda: view.get_total_count(queryset)  # noqa: E731
+        self.django_paginator_class = lambda *args, **kwargs: CountedPaginator(
+            *args, count_func=count_func, **kwargs
+        )
+        return super().paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Async version of ``paginate_queryset``; the view may define ``aget_total_count``"""
+        self.request = request
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+
+        if view is not None and hasattr(view, 'aget_total_count'):
+            total = await view.aget_total_count(queryset)
+        else:
+            total = await queryset.acount()
+        paginator = CountedPaginator(queryset, page_size, count_func=lambda: total)
+        page_number = self.get_page_number(request, paginator)
+        try:
+            number = paginator.validate_number(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            raise NotFound(msg)
+
+        bottom = (number - 1) * paginator.per_page
+        rows = [row async for row in queryset[bottom:bottom + paginator.per_page]]
+        self.page = paginator._get_page(rows, number, paginator)
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        return rows
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a stable, unique ordering.
+
+    The cursor encodes the ordering values of the last row on the page, and
+    the next page is fetched with a ``WHERE (a, b) < (x, y)`` style predicate,
+    so deep pages cost the same as the first one and rows inserted or deleted
+    while a client walks the list never cause duplicates or gaps among the
+    remaining rows. No total is computed unless ``include_total`` is passed,
+    in which case it is taken from ``view.get_total_count(queryset)``.
+    """
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    total_query_param = 'include_total'
+    ordering = ('-created_at', '-id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_queryset = self.get_page_queryset(queryset, request, view)
+        self.set_page(list(page_queryset[:self.page_size + 1]))
+
+        self.total = None
+        if self.wants_total(request) and view is not None and hasattr(view, 'get_total_count'):
+            self.total = view.get_total_count(queryset)
+        return self.page
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Async version of ``paginate_queryset``; the total comes from ``view.aget_total_count``"""
+        page_queryset = self.get_page_queryset(queryset, request, view)
+        self.set_page([row async for row in page_queryset[:self.page_size + 1]])
+
+        self.total = None
+        if self.wants_total(request) and view is not None and hasattr(view, 'aget_total_count'):
+            self.total = await view.aget_total_count(queryset)
+        return self.page
+
+    def get_page_queryset(self, queryset, request, view):
+        self.request = request
+        self.view = view
+        self.ordering = tuple(getattr(view, 'keyset_ordering', None) or self.ordering)
+        self.page_size = self.get_page_size(request)
+
+        page_queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request)
+        if position is not None:
+            page_queryset = page_queryset.filter(self.build_seek_filter(queryset.model, position))
+        return page_queryset
+
+    def set_page(self, rows):
+        # One extra row was fetched to tell whether a next page exists
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+
+    def wants_total(self, request):
+        return request.query_params.get(self.total_query_param, '').lower() in TRUTHY
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+            if size > 0:
+                return min(size, self.max_page_size)
+        except (KeyError, ValueError):
+            pass
+        return self.page_size
+
+    def get_paginated_response(self, data):
+        payload = {'next': self.get_next_link(), 'results': data}
+        if self.total is not None:
+            payload = {'count': self.total, **payload}
+        return Response(payload)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        last = self.page[-1]
+        values = [getattr(last, field.lstrip('-')) for field in self.ordering]
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(values))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer'},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    # Cursor encoding
+
+    def encode_cursor(self, values):
+        raw = json.dumps([self._to_json(value) for value in values], separators=(',', ':'))
+        return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        except (TypeError, ValueError, binascii.Error, UnicodeError):
+            raise ParseError(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise ParseError(self.invalid_cursor_message)
+        return values
+
+    def build_seek_filter(self, model, values):
+        """
+        Build ``(f1 > v1) OR (f1 = v1 AND f2 > v2) OR ...`` with each
+        comparison following that field's sort direction.
+        """
+        names = [field.lstrip('-') for field in self.ordering]
+        try:
+            parsed = [
+                model._meta.get_field(name).to_python(value)
+                for name, value in zip(names, values)
+            ]
+        except Exception:
+            raise ParseError(self.invalid_cursor_message)
+        if any(value is None for value in parsed):
+            raise ParseError(self.invalid_cursor_message)
+
+        condition = Q()
+        for index, field in enumerate(self.ordering):
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            term = Q(**{f'{names[index]}__{lookup}': parsed[index]})
+            for prior in range(index):
+                term &= Q(**{names[prior]: parsed[prior]})
+            condition |= term
+        return condition
+
+    @staticmethod
+    def _to_json(value):
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return str(value)
+
+
+class ApplicationPagination(BasePagination):
+    """
+    Pagination for the applications API, selectable per request.
+
+    Page numbers (``?page=``) remain the default. Passing ``?pagination=cursor``
+    or a ``cursor`` switches to keyset pagination on the view's ordering
+    (``keyset_ordering``, by default (created_at, id)).
+    """
+    mode_query_param = 'pagination'
+
+    def __init__(self):
+        self.delegate = None
+
+    def select(self, request):
+        if request.query_params.get(self.mode_query_param) == 'cursor':
+            return KeysetPagination()
+        if request.query_params.get(KeysetPagination.cursor_query_param):
+            return KeysetPagination()
+        return CheapCountPageNumberPagination()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.delegate = self.select(request)
+        return self.delegate.paginate_queryset(queryset, request, view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        self.delegate = self.select(request)
+        return await self.delegate.apaginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.delegate.get_paginated_response(data)
+
+    def to_html(self):
+        return self.delegate.to_html() if self.delegate else ''
@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+class CSVRenderer(BaseRenderer):
+    """
+    Selects CSV for ``?format=csv``; streamed exports bypass render(), which
+    only formats error payloads.
+    """
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if not isinstance(data, dict):
+            data = {'detail': data}
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(['field', 'message'])
+        for key, value in data.items():
+            writer.writerow([key, value])
+        return buffer.getvalue().encode(self.charset)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Newline-delimited JSON; error payloads are rendered as a single line"""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return (json.dumps(data, default=str) + '\n').encode(self.charset)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is installed
+
+    Compact output only: requests for indented JSON (``; indent=N`` in the
+    Accept header) and environments without orjson use DRF's encoder.
+    Datetimes, dates and times are passed through to DRF's
+    JSONEncoder.default (millisecond precision, ``Z`` for UTC), as are the
+    types orjson does not know (Decimal, lazy strings, querysets...), so
+    values encode as DRF's renderer would. Remaining differences: U+2028 and
+    U+2029 are not escaped, NaN and infinities become null instead of
+    raising, and dict keys other than str, int, float, bool and None are
+    stringified instead of raising.
+    """
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(data, default=JSONEncoder().default, option=self.options)
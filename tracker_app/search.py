@@ -0,0 +1,118 @@
+"""
+Ranked full-text search over company, role, location and notes.
+
+PostgreSQL uses the generated ``search_vector`` column and its GIN index;
+SQLite uses the ``tracker_app_application_fts`` FTS5 table. Both are created
+by migration 0003 and maintained by the database itself, so every write path
+(including bulk ones) keeps the index current. Other backends, or SQLite
+builds without FTS5, fall back to unindexed ``icontains`` matching.
+
+Note that the SQLite triggers live on tracker_app_application: a future
+migration that makes Django rebuild that table on SQLite must recreate them.
+"""
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+from .models import Application
+
+
+FTS_TABLE = 'tracker_app_application_fts'
+FTS_MAP_TABLE = 'tracker_app_application_fts_map'
+
+# bm25() column weights: company_name, role, location, notes, owner
+SQLITE_WEIGHTS = (10.0, 10.0, 4.0, 1.0, 0.0)
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+_sqlite_fts_available = None
+
+
+def tokenize(query):
+    return TOKEN_RE.findall(query or '')
+
+
+def sqlite_fts_available():
+    global _sqlite_fts_available
+    if _sqlite_fts_available is None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [FTS_TABLE],
+            )
+            _sqlite_fts_available = bool(cursor.fetchone()[0])
+    return _sqlite_fts_available
+
+
+def search_backend():
+    if connection.vendor == 'postgresql':
+        return 'postgresql'
+    if connection.vendor == 'sqlite' and sqlite_fts_available():
+        return 'sqlite'
+    return 'fallback'
+
+
+def search_applications(user, query, limit=20, offset=0):
+    """
+    Return up to ``limit`` of ``user``'s applications matching ``query``,
+    best match first, skipping the first ``offset`` results.
+    """
+    if not tokenize(query):
+        return []
+
+    backend = search_backend()
+    if backend == 'postgresql':
+        return _search_postgresql(user, query, limit, offset)
+    if backend == 'sqlite':
+        return _search_sqlite(user, query, limit, offset)
+    return _search_fallback(user, query, limit, offset)
+
+
+def _search_postgresql(user, query, limit, offset):
+    tsquery = "websearch_to_tsquery('english', %s)"
+    applications = Application.objects.filter(
+        RawSQL(f'search_vector @@ {tsquery}', [query], output_field=BooleanField()),
+        user=user,
+    ).annotate(
+        rank=RawSQL(f'ts_rank_cd(search_vector, {tsquery})', [query], output_field=FloatField())
+    ).order_by('-rank', '-created_at', '-id')
+    return list(applications.select_related('user')[offset:offset + limit])
+
+
+def _sqlite_match_expression(user, query):
+    # Quote every token so user input cannot inject FTS5 syntax; the trailing
+    # '*' makes the last token a prefix match for search-as-you-type
+    tokens = tokenize(query)
+    terms = [f'"{token}"' for token in tokens[:-1]] + [f'"{tokens[-1]}"*']
+    return f'owner:"u{user.pk}" AND ({" ".join(terms)})'
+
+
+def _search_sqlite(user, query, limit, offset):
+    weights = ', '.join(str(weight) for weight in SQLITE_WEIGHTS)
+    sql = (
+        f'SELECT m.application_id FROM {FTS_TABLE} '
+        f'JOIN {FTS_MAP_TABLE} m ON m.rowid = {FTS_TABLE}.rowid '
+        f'WHERE {FTS_TABLE} MATCH %s '
+        f'ORDER BY bm25({FTS_TABLE}, {weights}) LIMIT %s OFFSET %s'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [_sqlite_match_expression(user, query), limit, offset])
+        ids = [row[0] for row in cursor.fetchall()]
+
+    field = Application._meta.pk
+    ids = [field.to_python(value) for value in ids]
+    by_id = Application.objects.filter(user=user, pk__in=ids).select_related('user').in_bulk()
+    return [by_id[pk] for pk in ids if pk in by_id]
+
+
+def _search_fallback(user, query, limit, offset):
+    condition = Q()
+    for token in tokenize(query):
+        condition &= (
+            Q(company_name__icontains=token) | Q(role__icontains=token) |
+            Q(location__icontains=token) | Q(notes__icontains=token)
+        )
+    applications = Application.objects.filter(condition, user=user).select_related('user')
+    return list(applications.order_by('-created_at', '-id')[offset:offset + limit])
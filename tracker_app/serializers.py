@@ -1,6 +1,12 @@
+import functools
+
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from django.conf import settings
 from django.contrib.auth import authenticate
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from .availability import email_taken, username_taken
 from .models import CustomUser, Application, RefreshToken
 
 
@@ -13,7 +19,7 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.fields['email'] = serializers.EmailField()
-        del self.fields['username']
+        self.fields.pop('username', None)
 
     @classmethod
     def get_token(cls, user):
@@ -53,14 +59,20 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         model = CustomUser
         fields = ('email', 'username', 'password', 'password_confirm', 'first_name', 'last_name')
 
+    email_taken_message = "A user with this email already exists."
+    username_taken_message = "A user with this username already exists."
+
+    # Registration is authoritative, so these skip the availability Bloom
+    # filter, which can miss users created by other workers
+
     def validate_email(self, value):
-        if CustomUser.objects.filter(email=value).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
+        if email_taken(value, use_filter=False):
+            raise serializers.ValidationError(self.email_taken_message)
         return value
 
     def validate_username(self, value):
-        if CustomUser.objects.filter(username=value).exists():
-            raise serializers.ValidationError("A user with this username already exists.")
+        if username_taken(value, use_filter=False):
+            raise serializers.ValidationError(self.username_taken_message)
         return value
 
     def validate(self, data):
@@ -70,7 +82,15 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data):
         validated_data.pop('password_confirm')
-        user = CustomUser.objects.create_user(**validated_data)
+        try:
+            with transaction.atomic():
+                user = CustomUser.objects.create_user(**validated_data)
+        except IntegrityError:
+            # A concurrent registration took the username or email after
+            # validation; the case-insensitive unique constraints caught it
+            if username_taken(validated_data['username'], use_filter=False):
+                raise serializers.ValidationError({'username': [self.username_taken_message]})
+            raise serializers.ValidationError({'email': [self.email_taken_message]})
         return user
 
 
@@ -84,9 +104,28 @@ class UserProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ('id', 'created_at', 'last_login')
 
 
+# Serialized application fields, in output order. ``?fields=`` may select
+# any subset; the value is the column each one is read from
+APPLICATION_FIELDS = {
+    'id': 'id',
+    'user': 'user__email',
+    'company_name': 'company_name',
+    'role': 'role',
+    'location': 'location',
+    'status': 'status',
+    'applied_date': 'applied_date',
+    'interview_date': 'interview_date',
+    'notes': 'notes',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+}
+
+
 class ApplicationSerializer(serializers.ModelSerializer):
     """
     Serializer for Application model
+
+    ``fields`` limits the output to a subset of APPLICATION_FIELDS.
     """
     user = serializers.StringRelatedField(read_only=True)
 
@@ -95,9 +134,13 @@ class ApplicationSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ('id', 'user', 'created_at', 'updated_at')
 
-    def validate_status(self):
-        status = self.validated_data.get('status')
-        
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    def validate_status(self, status):
         # If we're updating an existing application
         if self.instance and self.instance.pk:
             # Prevent skipping from WISHLIST directly to OFFER
@@ -109,6 +152,101 @@ class ApplicationSerializer(serializers.ModelSerializer):
         return status
 
 
+class ApplicationRecordSerializer:
+    """
+    Read-only fast path for ApplicationSerializer on list responses
+
+    ``rows()`` turns a queryset into ``values_list(named=True)`` records, so
+    no model instances are built and ``user`` is read through a join instead
+    of a related object. ``data`` maps each record straight to the dict
+    ApplicationSerializer would produce (``user`` is the owner's email, which
+    is what ``CustomUser.__str__`` returns), skipping per-field serializer
+    dispatch. Records keep attribute access, so keyset cursors and dashboard
+    grouping read them like instances.
+
+    With ``fields`` only those columns are selected and serialized; ``rows``
+    also selects the fields named in ``extra`` (e.g. the ordering a cursor
+    is built from) without them reaching the output.
+    """
+    lookups = tuple(APPLICATION_FIELDS.values())
+
+    def __init__(self, instance=None, many=False, fields=None, **kwargs):
+        self.instance = instance
+        self.many = many
+        self.fields = fields
+
+    @classmethod
+    def rows(cls, queryset, fields=None, extra=()):
+        if fields is None:
+            return queryset.values_list(*cls.lookups, named=True)
+        selected = set(fields).union(name.lstrip('-') for name in extra)
+        return queryset.values_list(
+            *(lookup for name, lookup in APPLICATION_FIELDS.items() if name in selected), named=True
+        )
+
+    @property
+    def data(self):
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        if self.fields is None:
+            represent = self.to_representation
+        else:
+            formats = [(name, APPLICATION_FIELDS[name], FIELD_FORMATS.get(name)) for name in self.fields]
+            represent = functools.partial(self.to_partial_representation, formats=formats)
+        if self.many:
+            return [represent(row, tz) for row in self.instance]
+        return represent(self.instance, tz)
+
+    @staticmethod
+    def to_representation(row, tz=None):
+        (pk, email, company_name, role, location, status,
+         applied_date, interview_date, notes, created_at, updated_at) = row
+        return {
+            'id': str(pk),
+            'user': email,
+            'company_name': company_name,
+            'role': role,
+            'location': location,
+            'status': status,
+            'applied_date': applied_date.isoformat(),
+            'interview_date': interview_date.isoformat() if interview_date else None,
+            'notes': notes,
+            'created_at': _iso_datetime(created_at, tz),
+            'updated_at': _iso_datetime(updated_at, tz),
+        }
+
+    @staticmethod
+    def to_partial_representation(row, tz=None, formats=()):
+        data = {}
+        for name, lookup, format_value in formats:
+            value = getattr(row, lookup)
+            data[name] = value if format_value is None or value is None else format_value(value, tz)
+        return data
+
+
+def _iso_datetime(value, tz):
+    # Same output as serializers.DateTimeField with the default ISO 8601 format
+    if tz is not None:
+        value = value.astimezone(tz)
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def _iso_date(value, tz):
+    return value.isoformat()
+
+
+# Conversions for non-string fields in ApplicationRecordSerializer.to_partial_representation
+FIELD_FORMATS = {
+    'id': lambda value, tz: str(value),
+    'applied_date': _iso_date,
+    'interview_date': _iso_date,
+    'created_at': _iso_datetime,
+    'updated_at': _iso_datetime,
+}
+
+
 class RefreshTokenSerializer(serializers.ModelSerializer):
     """
     Serializer for RefreshToken model
@@ -0,0 +1,44 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_user_state
+from .availability import record_user
+from .counters import mark_changed, record_status_change, schedule_rebuild
+from .models import Application, CustomUser
+from .user_cache import invalidate_user
+
+
+@receiver(post_save, sender=Application)
+def application_saved(sender, instance, created, update_fields=None, **kwargs):
+    """Adjust status counters and invalidate the owner's dashboard cache"""
+    if created:
+        record_status_change(instance.user_id, None, instance.status)
+    elif update_fields is not None and 'status' not in update_fields:
+        mark_changed(instance.user_id)
+    elif getattr(instance, '_loaded_status', None) is None:
+        # The stored status was never loaded (e.g. deferred), so recount
+        schedule_rebuild(instance.user_id)
+    else:
+        record_status_change(instance.user_id, instance._loaded_status, instance.status)
+
+
+@receiver(post_delete, sender=Application)
+def application_deleted(sender, instance, **kwargs):
+    old_status = getattr(instance, '_loaded_status', None) or instance.status
+    record_status_change(instance.user_id, old_status, None)
+
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def user_changed(sender, instance, **kwargs):
+    """Drop the cached user and the account state used by claims-only authentication"""
+    user_id = instance.pk
+    transaction.on_commit(lambda: invalidate_user(user_id))
+    transaction.on_commit(lambda: invalidate_user_state(user_id))
+
+
+@receiver(post_save, sender=CustomUser)
+def user_saved(sender, instance, **kwargs):
+    """Keep this process's availability filter aware of new and renamed users"""
+    record_user(instance)
@@ -0,0 +1,218 @@
+"""
+Rate limits for the anonymous auth and availability endpoints.
+
+Each limit is a fixed-window counter in the ``THROTTLE_CACHE_ALIAS`` cache,
+keyed by scope, identity and window number. Point that cache at Redis with
+CACHE_URL (or THROTTLE_CACHE_URL) so every worker shares the counters. A check is one
+``incr`` round trip. Only the first request of a window pays an extra
+``add``. The key carries the window number, so it expires on its own and
+nothing needs resetting. ``Retry-After`` is the time left in the window.
+
+Rates come from ``REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']``, e.g.
+``'login': '20/min'``. A scope with no rate is not throttled. The same
+counters back the DRF throttle classes and the ``throttle`` decorator for
+plain Django views.
+
+Per-account limits count attempts on one account from one client address.
+Keyed on the account alone, anyone could lock a victim out by sending wrong
+passwords for it; the per-IP limits bound how many accounts one address can
+try.
+
+A fixed window can let through up to twice the rate across a window
+boundary. That is acceptable for abuse limits and keeps each check to one
+round trip.
+"""
+import hashlib
+import math
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse, JsonResponse
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle, SimpleRateThrottle
+
+from . import metrics
+
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def get_store():
+    return caches[settings.THROTTLE_CACHE_ALIAS]
+
+
+def get_rate(scope):
+    """Return ``(num_requests, duration)`` for a scope, or None when it is not throttled"""
+    rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope)
+    if not rate:
+        return None
+    num, period = rate.split('/')
+    return int(num), PERIODS[period[0]]
+
+
+def _window(scope, ident, duration, now):
+    now = time.time() if now is None else now
+    window = int(now // duration)
+    retry_after = max(1, math.ceil((window + 1) * duration - now))
+    return f'throttle:{scope}:{ident}:{window}', retry_after
+
+
+def _verdict(scope, count, num_requests, retry_after):
+    if count <= num_requests:
+        return True, 0
+    metrics.incr(f'throttle.{scope}.rejected')
+    return False, retry_after
+
+
+def hit(scope, ident, num_requests, duration, now=None):
+    """
+    Count one request for ``ident`` in ``scope``
+
+    Returns ``(allowed, retry_after)``. ``retry_after`` is the number of
+    seconds until the current window ends.
+    """
+    key, retry_after = _window(scope, ident, duration, now)
+    store = get_store()
+    try:
+        count = store.incr(key)
+    except ValueError:
+        # First request in this window (or the counter was evicted)
+        if store.add(key, 1, duration + 1):
+            count = 1
+        else:
+            count = store.incr(key)
+    return _verdict(scope, count, num_requests, retry_after)
+
+
+async def ahit(scope, ident, num_requests, duration, now=None):
+    """Async version of ``hit``"""
+    key, retry_after = _window(scope, ident, duration, now)
+    store = get_store()
+    try:
+        count = await store.aincr(key)
+    except ValueError:
+        if await store.aadd(key, 1, duration + 1):
+            count = 1
+        else:
+            count = await store.aincr(key)
+    return _verdict(scope, count, num_requests, retry_after)
+
+
+def client_ident(request):
+    """Client address, honouring REST_FRAMEWORK['NUM_PROXIES'] like DRF's throttles"""
+    return BaseThrottle().get_ident(request)
+
+
+def account_ident(value, request):
+    """Stable, non-reversible key for an email or username tried from the request's client address"""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    account = f'{value.strip().lower()}|{client_ident(request)}'
+    return hashlib.sha256(account.encode('utf-8')).hexdigest()[:32]
+
+
+class CounterRateThrottle(SimpleRateThrottle):
+    """SimpleRateThrottle on the shared fixed-window counters instead of a timestamp history"""
+
+    def get_rate(self):
+        # Read at request time so the rates follow settings changes
+        return api_settings.DEFAULT_THROTTLE_RATES.get(self.scope)
+
+    def get_ident_for(self, request, view):
+        raise NotImplementedError
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+        ident = self.get_ident_for(request, view)
+        if ident is None:
+            return True
+        allowed, self.retry_after = hit(self.scope, ident, self.num_requests, self.duration)
+        return allowed
+
+    def wait(self):
+        return self.retry_after
+
+
+class IPRateThrottle(CounterRateThrottle):
+    """Limits requests per client address"""
+
+    def get_ident_for(self, request, view):
+        return client_ident(request)
+
+
+class AccountRateThrottle(CounterRateThrottle):
+    """Limits requests per account named in the request body and client address"""
+
+    account_field = 'email'
+
+    def get_ident_for(self, request, view):
+        return account_ident(request.data.get(self.account_field), request)
+
+
+class LoginIPThrottle(IPRateThrottle):
+    scope = 'login'
+
+
+class LoginAccountThrottle(AccountRateThrottle):
+    scope = 'login_account'
+
+
+class RegisterIPThrottle(IPRateThrottle):
+    scope = 'register'
+
+
+class RefreshIPThrottle(IPRateThrottle):
+    scope = 'refresh'
+
+
+def throttled_response(request, retry_after):
+    message = 'Too many requests. Please try again later.'
+    if request.path.startswith('/api/'):
+        response = JsonResponse({'error': message}, status=429)
+    else:
+        response = HttpResponse(message, status=429, content_type='text/plain')
+    response['Retry-After'] = str(retry_after)
+    return response
+
+
+def throttle(scope, account_field=None, methods=None):
+    """
+    Throttle a plain Django view with the same counters as the DRF classes
+
+    Counts per client address, or per the account named in the POST field
+    ``account_field`` and client address when given. ``methods`` limits which methods count;
+    by default all do. Works on sync and async views.
+    """
+    def identify(request):
+        rate = get_rate(scope)
+        if rate is None or (methods is not None and request.method not in methods):
+            return None, None
+        if account_field:
+            return account_ident(request.POST.get(account_field), request), rate
+        return client_ident(request), rate
+
+    def decorator(view_func):
+        if iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def wrapped(request, *args, **kwargs):
+                ident, rate = identify(request)
+                if ident is not None:
+                    allowed, retry_after = await ahit(scope, ident, *rate)
+                    if not allowed:
+                        return throttled_response(request, retry_after)
+                return await view_func(request, *args, **kwargs)
+        else:
+            @wraps(view_func)
+            def wrapped(request, *args, **kwargs):
+                ident, rate = identify(request)
+                if ident is not None:
+                    allowed, retry_after = hit(scope, ident, *rate)
+                    if not allowed:
+                        return throttled_response(request, retry_after)
+                return view_func(request, *args, **kwargs)
+        return wrapped
+    return decorator
@@ -0,0 +1,133 @@
+"""
+Removal of dead RefreshToken rows.
+
+Expired tokens are deleted once they expire. Revoked tokens are kept for
+``REFRESH_TOKEN_REVOKED_RETENTION_DAYS`` after revocation for auditing. Rows
+revoked before ``revoked_at`` existed fall back to ``created_at``.
+
+Access token revocations kept in the database (see tracker_app.denylist)
+are deleted once the token they deny has expired.
+
+Rows are deleted in batches of primary keys, each batch in its own short
+transaction, so the purge never holds locks on a large part of the table.
+``start_periodic_purge()`` runs the same purge on a background thread every
+``REFRESH_TOKEN_PURGE_INTERVAL`` seconds.
+"""
+import datetime
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from . import metrics
+from .models import AccessTokenRevocation, RefreshToken
+
+
+logger = logging.getLogger(__name__)
+
+
+def purgeable_tokens(now=None, retention_days=None):
+    now = now or timezone.now()
+    if retention_days is None:
+        retention_days = settings.REFRESH_TOKEN_REVOKED_RETENTION_DAYS
+    cutoff = now - datetime.timedelta(days=retention_days)
+
+    expired = Q(is_revoked=False, expires_at__lte=now)
+    revoked = Q(is_revoked=True) & (
+        Q(revoked_at__lt=cutoff) | Q(revoked_at__isnull=True, created_at__lt=cutoff)
+    )
+    return RefreshToken.objects.filter(expired | revoked)
+
+
+def purge_tokens(batch_size=None, retention_days=None, pause=0.0, max_batches=None):
+    """Delete purgeable tokens in batches; returns the number of rows deleted"""
+    batch_size = batch_size or settings.REFRESH_TOKEN_PURGE_BATCH_SIZE
+    now = timezone.now()
+    deleted = 0
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        with transaction.atomic():
+            ids = list(
+                purgeable_tokens(now, retention_days).order_by().values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            count, _ = RefreshToken.objects.filter(pk__in=ids).delete()
+        deleted += count
+        batches += 1
+        metrics.incr('token_reaper.deleted', count)
+        if len(ids) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    return deleted
+
+
+def purge_revocations(batch_size=None, pause=0.0):
+    """Delete expired access token revocations in batches; returns the number deleted"""
+    batch_size = batch_size or settings.REFRESH_TOKEN_PURGE_BATCH_SIZE
+    now = timezone.now()
+    deleted = 0
+
+    while True:
+        with transaction.atomic():
+            keys = list(
+                AccessTokenRevocation.objects.filter(expires_at__lte=now)
+                .order_by().values_list('pk', flat=True)[:batch_size]
+            )
+            if not keys:
+                break
+            count, _ = AccessTokenRevocation.objects.filter(pk__in=keys).delete()
+        deleted += count
+        metrics.incr('token_reaper.revocations_deleted', count)
+        if len(keys) < batch_size:
+            break
+        if pause:
+            time.sleep(pause)
+
+    return deleted
+
+
+_thread = None
+_thread_lock = threading.Lock()
+
+
+def _run_periodically(interval):
+    while True:
+        time.sleep(interval)
+        try:
+            deleted = purge_tokens(pause=0.05)
+            if deleted:
+                logger.info('Purged %d refresh token(s)', deleted)
+            deleted = purge_revocations(pause=0.05)
+            if deleted:
+                logger.info('Purged %d access token revocation(s)', deleted)
+        except Exception:
+            logger.exception('Refresh token purge failed')
+        finally:
+            close_old_connections()
+
+
+def start_periodic_purge(**kwargs):
+    """
+    Start the background purge thread once per process.
+
+    Connected to ``request_started`` when REFRESH_TOKEN_PURGE_INTERVAL is set,
+    so only serving processes run it and management commands do not.
+    """
+    global _thread
+    interval = settings.REFRESH_TOKEN_PURGE_INTERVAL
+    if interval <= 0 or _thread is not None:
+        return
+    with _thread_lock:
+        if _thread is None:
+            _thread = threading.Thread(
+                target=_run_periodically, args=(interval,), name='token-reaper', daemon=True
+            )
+            _thread.start()
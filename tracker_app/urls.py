@@ -1,7 +1,13 @@
+from django.conf import settings
 from django.urls import path
 from django.contrib.auth import views as auth_views
 from . import views
 
+if settings.API_ASYNC_VIEWS:
+    from . import async_views as availability_views
+else:
+    availability_views = views
+
 urlpatterns = [
     # Authentication URLs
     path('register/', views.register_view, name='register'),
@@ -9,8 +15,9 @@ urlpatterns = [
     path('logout/', views.logout_view, name='logout'),
     
     # AJAX endpoints for duplicate checking
-    path('api/check-username/', views.check_username_availability, name='check_username'),
-    path('api/check-email/', views.check_email_availability, name='check_email'),
+    path('api/check-username/', availability_views.check_username_availability, name='check_username'),
+    path('api/check-email/', availability_views.check_email_availability, name='check_email'),
+    path('api/check-availability/', availability_views.check_availability, name='check_availability'),
     
     # Application URLs
     path('', views.dashboard_view, name='dashboard'),
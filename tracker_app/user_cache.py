@@ -0,0 +1,117 @@
+"""
+Cached CustomUser loader for session-authenticated requests.
+
+Users are cached in two layers keyed by user id and a per-user version:
+
+* a per-process LRU of up to ``USER_CACHE_LRU_SIZE`` users, each trusted
+  for at most ``USER_CACHE_LOCAL_TTL`` seconds;
+* the shared Django cache, for ``USER_CACHE_TIMEOUT`` seconds, when
+  ``SHARED_CACHE`` is on (``CACHE_URL`` is set).
+
+A request reads the version from the cache and then, normally, finds the
+user in the local LRU, so the steady state costs no SQL. Saving or deleting
+a user replaces the version after commit. That covers profile edits,
+password changes, ``is_active`` flips, admin edits and logins, which update
+``last_login``. Entries under the old version are never read again. Queryset
+``update()`` calls on CustomUser bypass the signal and must call
+``invalidate_user`` themselves.
+
+With a shared cache every worker sees a new version on its next request.
+Without one the version only changes in the process that saved the user,
+so the shared layer is skipped and other processes pick up the change when
+their LRU entry expires, after at most ``USER_CACHE_LOCAL_TTL`` seconds.
+The TTL also bounds staleness if a shared version write is ever lost.
+
+Callers get a copy of the cached instance, so changes made while handling one
+request never leak into another.
+"""
+import copy
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import metrics
+from .models import CustomUser
+
+
+_lock = threading.Lock()
+_local = OrderedDict()
+
+
+def _version_key(user_id):
+    return f'user:version:{user_id}'
+
+
+def _user_key(user_id, version):
+    return f'user:{user_id}:{version}'
+
+
+def get_user_version(user_id):
+    key = _version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = uuid.uuid4().hex
+        if not cache.add(key, version, None):
+            version = cache.get(key, version)
+    return version
+
+
+def invalidate_user(user_id):
+    cache.set(_version_key(user_id), uuid.uuid4().hex, None)
+    metrics.incr('user_cache.invalidations')
+
+
+def _remember(key, user):
+    expires_at = time.monotonic() + settings.USER_CACHE_LOCAL_TTL
+    with _lock:
+        _local[key] = (user, expires_at)
+        _local.move_to_end(key)
+        while len(_local) > settings.USER_CACHE_LRU_SIZE:
+            _local.popitem(last=False)
+
+
+def _local_user(key):
+    with _lock:
+        entry = _local.get(key)
+        if entry is None:
+            return None
+        user, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del _local[key]
+            return None
+        _local.move_to_end(key)
+        return user
+
+
+def get_cached_user(user_id):
+    """Return a copy of the user with ``user_id``, or None if there is none"""
+    key = _user_key(user_id, get_user_version(user_id))
+
+    user = _local_user(key)
+    if user is not None:
+        metrics.incr('user_cache.local_hits')
+        return copy.copy(user)
+
+    user = cache.get(key) if settings.SHARED_CACHE else None
+    if user is not None:
+        metrics.incr('user_cache.shared_hits')
+    else:
+        metrics.incr('user_cache.misses')
+        user = CustomUser.objects.filter(pk=user_id).first()
+        if user is None:
+            return None
+        if settings.SHARED_CACHE:
+            cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+
+    _remember(key, user)
+    return copy.copy(user)
+
+
+def clear():
+    """Forget the local LRU (tests)"""
+    with _lock:
+        _local.clear()
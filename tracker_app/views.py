@@ -2,55 +2,58 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import login, logout, authenticate
 from django.contrib import messages
+from django.db import IntegrityError
 from django.db.models import Count, Q
 from django.http import Http404, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_GET
 import json
+from . import availability
 from .models import Application, CustomUser
+from .dashboard import build_dashboard, get_cached_dashboard
+from .hashing import PasswordHashingBusy
+from .search import search_applications
+from .throttling import throttle
 from .forms import ApplicationForm, CustomUserCreationForm, CustomAuthenticationForm
 
 
 @require_GET
+@throttle('availability')
 def check_username_availability(request):
     """AJAX endpoint to check username availability"""
-    username = request.GET.get('username', '').strip()
-    
-    if not username:
-        return JsonResponse({'error': 'Username is required'}, status=400)
-    
-    if len(username) < 3:
-        return JsonResponse({'error': 'Username must be at least 3 characters'}, status=400)
-    
-    # Check if username exists (case-insensitive)
-    exists = CustomUser.objects.filter(username__iexact=username).exists()
-    
-    return JsonResponse({
-        'available': not exists,
-        'message': 'Username available' if not exists else f'Username "{username}" is already taken'
-    })
+    status, payload = availability.check_username(request.GET.get('username'))
+    return JsonResponse(payload, status=status)
 
 
 @require_GET
+@throttle('availability')
 def check_email_availability(request):
     """AJAX endpoint to check email availability"""
-    email = request.GET.get('email', '').strip()
-    
-    if not email:
-        return JsonResponse({'error': 'Email is required'}, status=400)
-    
-    if '@' not in email:
-        return JsonResponse({'error': 'Invalid email format'}, status=400)
-    
-    # Check if email exists (case-insensitive)
-    exists = CustomUser.objects.filter(email__iexact=email).exists()
-    
-    return JsonResponse({
-        'available': not exists,
-        'message': 'Email available' if not exists else f'An account with email "{email}" already exists'
-    })
+    status, payload = availability.check_email(request.GET.get('email'))
+    return JsonResponse(payload, status=status)
 
 
+@require_GET
+@throttle('availability')
+def check_availability(request):
+    """
+    AJAX endpoint checking ``username`` and/or ``email`` in one request
+
+    Returns one entry per supplied field, each shaped like the single-field
+    endpoints' responses.
+    """
+    checks = {'username': availability.check_username, 'email': availability.check_email}
+    results = {
+        field: check(request.GET[field])[1]
+        for field, check in checks.items()
+        if field in request.GET
+    }
+    if not results:
+        return JsonResponse({'error': 'Pass username and/or email'}, status=400)
+    return JsonResponse(results)
+
+
+@throttle('register', methods=('POST',))
 def register_view(request):
     """User registration view with duplicate account prevention"""
     if request.user.is_authenticated:
@@ -67,6 +70,11 @@ def register_view(request):
                 login(request, user)
                 messages.success(request, f'Welcome to Placement Tracker, {user.username}! Your account has been created successfully.')
                 return redirect('dashboard')
+            except PasswordHashingBusy:
+                raise
+            except IntegrityError:
+                # Another registration took the username or email after validation
+                messages.error(request, 'An account with this username or email already exists. Please try logging in.')
             except Exception as e:
                 messages.error(request, 'An error occurred during registration. Please try again.')
         else:
@@ -84,6 +92,8 @@ def register_view(request):
     return render(request, 'registration/register.html', {'form': form})
 
 
+@throttle('login', methods=('POST',))
+@throttle('login_account', account_field='username', methods=('POST',))
 def login_view(request):
     """Custom login view that works with CustomUser and email authentication"""
     if request.user.is_authenticated:
@@ -119,32 +129,17 @@ def logout_view(request):
 @login_required
 def dashboard_view(request):
     """Main dashboard with Kanban board"""
-    # Get all applications for the current user
-    applications = Application.objects.filter(user=request.user).select_related('user')
-    
-    # Group applications by status
-    status_groups = {}
-    for choice in Application.STATUS_CHOICES:
-        status_code, status_name = choice
-        status_groups[status_code] = {
-            'name': status_name,
-            'applications': applications.filter(status=status_code),
-            'count': applications.filter(status=status_code).count()
-        }
-    
-    # Calculate stats
-    total_applications = applications.count()
-    total_interviews = applications.filter(status__in=['INTERVIEW', 'OFFER']).count()
-    total_offers = applications.filter(status='OFFER').count()
-    success_rate = (total_offers / total_applications * 100) if total_applications > 0 else 0
-    
+    dashboard = get_cached_dashboard(request.user, 'html', lambda: build_dashboard(request.user))
+
     context = {
-        'status_groups': status_groups,
-        'total_applications': total_applications,
-        'total_interviews': total_interviews,
-        'total_offers': total_offers,
-        'success_rate': round(success_rate, 1),
+        'status_groups': dashboard['status_groups'],
+        **dashboard['stats'],
     }
+
+    query = request.GET.get('q', '').strip()
+    if query:
+        context['search_query'] = query
+        context['search_results'] = search_applications(request.user, query, limit=50)
     
     return render(request, 'tracker/dashboard.html', context)
 